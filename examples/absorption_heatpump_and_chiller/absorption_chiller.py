@@ -27,8 +27,8 @@ def absorption_chiller_example():
     filename_charpara = os.path.join(
         os.path.dirname(__file__), "data/characteristic_parameters.csv"
     )
-    charpara = pd.read_csv(filename_charpara)
-    chiller_name = "Kuehn"
+    library = abs_hp_chiller.load_characteristic_parameters(filename_charpara)
+    chiller = library["Kuehn"]
 
     # Buses with three different temperature levels
     b_th_high = solph.Bus(label="hot")
@@ -61,32 +61,18 @@ def absorption_chiller_example():
     # Mean cooling water temperature in degC (dry cooling tower)
     temp_difference = 4
     t_cooling = [t + temp_difference for t in data["air_temperature"]]
-    n = len(t_cooling)
 
     # Pre-Calculations
-    ddt = abs_hp_chiller.calc_characteristic_temp(
-        t_hot=[85],
+    nominal_Q_dots_evap = 10
+    operation = abs_hp_chiller.calc_chiller_operation(
+        t_hot=85,
         t_cool=t_cooling,
-        t_chill=[15] * n,
-        coef_a=charpara[(charpara["name"] == chiller_name)]["a"].values[0],
-        coef_e=charpara[(charpara["name"] == chiller_name)]["e"].values[0],
-        method="kuehn_and_ziegler",
-    )
-    Q_dots_evap = abs_hp_chiller.calc_heat_flux(
-        ddts=ddt,
-        coef_s=charpara[(charpara["name"] == chiller_name)]["s_E"].values[0],
-        coef_r=charpara[(charpara["name"] == chiller_name)]["r_E"].values[0],
-        method="kuehn_and_ziegler",
+        t_chill=15,
+        parameters=chiller,
+        nominal_Q_dot_evap=nominal_Q_dots_evap,
     )
-    Q_dots_gen = abs_hp_chiller.calc_heat_flux(
-        ddts=ddt,
-        coef_s=charpara[(charpara["name"] == chiller_name)]["s_G"].values[0],
-        coef_r=charpara[(charpara["name"] == chiller_name)]["r_G"].values[0],
-        method="kuehn_and_ziegler",
-    )
-    COPs = [Qevap / Qgen for Qgen, Qevap in zip(Q_dots_gen, Q_dots_evap)]
-    nominal_Q_dots_evap = 10
-    actual_value = [Q_e / nominal_Q_dots_evap for Q_e in Q_dots_evap]
+    COPs = operation["COPs"]
+    actual_value = operation["Q_chill_max"]
 
     # Absorption Chiller
     energysystem.add(
@@ -1,7 +1,6 @@
 import os
 
 import matplotlib.pyplot as plt
-import pandas as pd
 
 import oemof.thermal.absorption_heatpumps_and_chillers as abs_hp_chiller
 
@@ -10,8 +9,7 @@ def cooling_cap_example():
     filename = os.path.join(
         os.path.dirname(__file__), "data/characteristic_parameters.csv"
     )
-    charpara = pd.read_csv(filename)
-    chiller_name = "Kuehn"
+    chiller = abs_hp_chiller.load_characteristic_parameters(filename)["Kuehn"]
 
     t_cooling = [23, 25, 27, 29, 31, 33, 35, 36, 37, 38, 39, 40]
 
@@ -19,20 +17,20 @@ def cooling_cap_example():
         t_hot=[75],
         t_cool=t_cooling,
         t_chill=[15],
-        coef_a=charpara[(charpara["name"] == chiller_name)]["a"].values[0],
-        coef_e=charpara[(charpara["name"] == chiller_name)]["e"].values[0],
+        coef_a=chiller.a,
+        coef_e=chiller.e,
         method="kuehn_and_ziegler",
     )
     Q_dots_evap_75 = abs_hp_chiller.calc_heat_flux(
         ddts=ddt_75,
-        coef_s=charpara[(charpara["name"] == chiller_name)]["s_E"].values[0],
-        coef_r=charpara[(charpara["name"] == chiller_name)]["r_E"].values[0],
+        coef_s=chiller.s_E,
+        coef_r=chiller.r_E,
         method="kuehn_and_ziegler",
     )
     Q_dots_gen_75 = abs_hp_chiller.calc_heat_flux(
         ddts=ddt_75,
-        coef_s=charpara[(charpara["name"] == chiller_name)]["s_G"].values[0],
-        coef_r=charpara[(charpara["name"] == chiller_name)]["r_G"].values[0],
+        coef_s=chiller.s_G,
+        coef_r=chiller.r_G,
         method="kuehn_and_ziegler",
     )
     COPs_75 = [
@@ -43,14 +41,14 @@ def cooling_cap_example():
         t_hot=[80],
         t_cool=t_cooling,
         t_chill=[15],
-        coef_a=charpara[(charpara["name"] == chiller_name)]["a"].values[0],
-        coef_e=charpara[(charpara["name"] == chiller_name)]["e"].values[0],
+        coef_a=chiller.a,
+        coef_e=chiller.e,
         method="kuehn_and_ziegler",
     )
     Q_dots_evap_80 = abs_hp_chiller.calc_heat_flux(
         ddts=ddt_80,
-        coef_s=charpara[(charpara["name"] == chiller_name)]["s_E"].values[0],
-        coef_r=charpara[(charpara["name"] == chiller_name)]["r_E"].values[0],
+        coef_s=chiller.s_E,
+        coef_r=chiller.r_E,
         method="kuehn_and_ziegler",
     )
 
@@ -0,0 +1,82 @@
+"""
+This example measures the time to import oemof.thermal and some of its
+submodules, each in a fresh interpreter, and lists the slowest imports
+reported by ``python -X importtime``.
+"""
+
+import statistics
+import subprocess
+import sys
+
+import pandas as pd
+
+STATEMENTS = [
+    "import oemof.thermal",
+    "from oemof.thermal import cogeneration",
+    "from oemof.thermal import stratified_thermal_storage",
+    "from oemof.thermal import facades",
+]
+
+
+def _import_time(statement):
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return float(output)
+
+
+def _slowest_imports(statement, count):
+    # -X importtime writes 'import time: self [us] | cumulative | name'
+    # to stderr
+    lines = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stderr.splitlines()
+    rows = []
+    for line in lines[1:]:
+        _, cumulative, name = line.split("|")
+        rows.append(
+            {
+                "module": name.strip(),
+                "cumulative [ms]": int(cumulative) / 1e3,
+            }
+        )
+    return (
+        pd.DataFrame(rows)
+        .sort_values("cumulative [ms]", ascending=False)
+        .head(count)
+        .set_index("module")
+    )
+
+
+def import_benchmark(repeat=5, count=10):
+    results = []
+    for statement in STATEMENTS:
+        durations = [_import_time(statement) for _ in range(repeat)]
+        results.append(
+            {
+                "statement": statement,
+                "min [ms]": 1e3 * min(durations),
+                "median [ms]": 1e3 * statistics.median(durations),
+            }
+        )
+
+    results = pd.DataFrame(results).set_index("statement")
+    print(results)
+    print(_slowest_imports(STATEMENTS[0], count))
+    return results
+
+
+if __name__ == "__main__":
+    import_benchmark()
@@ -0,0 +1,62 @@
+"""
+This example measures the time to build and add StratifiedThermalStorage
+facades to an energy system depending on the number of facades.
+"""
+
+import time
+
+import pandas as pd
+from oemof.solph import Bus
+from oemof.solph import EnergySystem
+
+from oemof.thermal import facades
+
+
+def facade_build_benchmark(counts=(100, 1000, 10000)):
+    results = []
+    for count in counts:
+        energysystem = EnergySystem(
+            timeindex=pd.date_range("1/1/2020", periods=24, freq="h"),
+            infer_last_interval=True,
+        )
+        bus_heat = Bus(label="bus_heat")
+        energysystem.add(bus_heat)
+
+        start = time.perf_counter()
+        storages = [
+            facades.StratifiedThermalStorage(
+                label=f"thermal_storage_{i}",
+                bus=bus_heat,
+                diameter=10,
+                height=10,
+                temp_h=95,
+                temp_c=60,
+                temp_env=10,
+                u_value=0.3,
+                capacity=1,
+            )
+            for i in range(count)
+        ]
+        build = time.perf_counter() - start
+
+        start = time.perf_counter()
+        facades.add_facades(energysystem, storages)
+        add = time.perf_counter() - start
+
+        results.append(
+            {
+                "facades": count,
+                "build [s]": build,
+                "add [s]": add,
+                "build per facade [ms]": 1e3 * build / count,
+                "add per facade [ms]": 1e3 * add / count,
+            }
+        )
+
+    results = pd.DataFrame(results).set_index("facades")
+    print(results)
+    return results
+
+
+if __name__ == "__main__":
+    facade_build_benchmark()
@@ -1,20 +1,31 @@
+import importlib
+
 __version__ = "0.0.9dev0"
 __project__ = "oemof.thermal"
 
-from . import absorption_heatpumps_and_chillers
-from . import cogeneration
-from . import compression_heatpumps_and_chillers
-from . import concentrating_solar_power
-from . import facades
-from . import solar_thermal_collector
-from . import stratified_thermal_storage
-
 __all__ = [
     "absorption_heatpumps_and_chillers",
     "compression_heatpumps_and_chillers",
     "facades",
+    "fluid_properties",
+    "parallel",
     "stratified_thermal_storage",
     "cogeneration",
     "concentrating_solar_power",
+    "solar_position",
     "solar_thermal_collector",
 ]
+
+
+def __getattr__(name):
+    # Submodules are imported on first access (PEP 562), so that heavy
+    # dependencies like pvlib or oemof.solph are only loaded when needed.
+    if name in __all__:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,109 @@
+# -*- coding: utf-8
+
+"""
+This module holds helpers shared by the modules of oemof.thermal.
+
+This file is part of project oemof (github.com/oemof/oemof-thermal). It's
+copyrighted by the contributors recorded in the version control history of the
+file, available from its original location:
+oemof-thermal/src/oemof/thermal/_helpers.py
+
+SPDX-License-Identifier: MIT
+"""
+
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def like_input(values, *inputs):
+    r"""
+    Returns the result `values` of a vectorised calculation in the
+    container type of its inputs.
+
+    * pandas.Series if any input is a Series. The index is taken from the
+      first Series of matching length.
+    * numpy.ndarray if any input is an array with at least one dimension.
+    * list if any input is a list.
+    * A single value otherwise.
+    """
+    values = np.asarray(values)
+    if any(isinstance(arg, pd.Series) for arg in inputs):
+        return pd.Series(values, index=series_index(values.size, *inputs))
+    if any(isinstance(arg, np.ndarray) and arg.ndim > 0 for arg in inputs):
+        return values
+    if any(isinstance(arg, list) for arg in inputs):
+        return values.tolist()
+    return values.item()
+
+
+def series_index(length, *inputs):
+    r"""
+    Returns the index of the first pandas.Series of the given length in
+    `inputs` or None.
+    """
+    for arg in inputs:
+        if isinstance(arg, pd.Series) and len(arg) == length:
+            return arg.index
+    return None
+
+
+class LRUCache(OrderedDict):
+    r"""
+    Dict which keeps the `maxsize` most recently used entries.
+
+    Reading or writing an entry marks it as most recently used. If more than
+    `maxsize` entries are stored, the least recently used one is dropped.
+    """
+
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("Argument 'maxsize' has to be at least 1.")
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def fingerprint(value):
+    r"""
+    Returns a hashable fingerprint of `value` for use as cache key.
+
+    pandas objects (including their index) and numpy arrays are reduced to
+    their type, shape, dtype and a digest of their data. Lists and tuples
+    are fingerprinted element-wise, other values are returned as they are.
+    """
+    if isinstance(value, (pd.Index, pd.Series, pd.DataFrame)):
+        dtype = (
+            str(value.dtypes.tolist())
+            if isinstance(value, pd.DataFrame)
+            else str(value.dtype)
+        )
+        values = pd.util.hash_pandas_object(value).to_numpy()
+        return (type(value).__name__, len(value), dtype, _digest(values))
+    if isinstance(value, np.ndarray):
+        return (
+            "ndarray",
+            value.shape,
+            str(value.dtype),
+            _digest(np.ascontiguousarray(value)),
+        )
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(fingerprint(v) for v in value))
+    return value
+
+
+def _digest(array):
+    r"""Returns a short hex digest of the data of a contiguous array."""
+    return hashlib.blake2b(array.tobytes(), digest_size=16).hexdigest()
@@ -11,6 +11,26 @@ oemof-thermal/src/oemof/thermal/absorption_heatpumps_and_chillers.py
 SPDX-License-Identifier: MIT
 """
 
+import numbers
+import os
+from collections import namedtuple
+from collections.abc import Mapping
+from types import MappingProxyType
+
+import numpy as np
+import pandas as pd
+
+from oemof.thermal._helpers import like_input
+from oemof.thermal._helpers import series_index
+
+#: Characteristic parameters of one absorption chiller
+CharacteristicParameters = namedtuple(
+    "CharacteristicParameters",
+    ["name", "id", "a", "e", "s_E", "r_E", "s_G", "r_G"],
+)
+
+_libraries = {}
+
 
 def calc_characteristic_temp(t_hot, t_cool, t_chill, coef_a, coef_e, method):
     r"""
@@ -20,17 +40,21 @@ def calc_characteristic_temp(t_hot, t_cool, t_chill, coef_a, coef_e, method):
 
     :math:`\Delta\Delta T = t_{G} - a \cdot t_{AC} + e \cdot t_{E}`
 
+    The temperatures are broadcast against each other, i.e. single values
+    (or inputs of length 1) are combined with every entry of the longer
+    inputs.
+
     Parameters
     ----------
-    t_hot : numeric
+    t_hot : numeric, list, numpy.ndarray or pandas.Series
         External arithmetic mean fluid temperature of hot water at heat
         exchanger (generator) [K]
 
-    t_cool : numeric
+    t_cool : numeric, list, numpy.ndarray or pandas.Series
         External arithmetic mean fluid temperature of cooling water at
         heat exchanger (absorber and condenser) [K]
 
-    t_chill : numeric
+    t_chill : numeric, list, numpy.ndarray or pandas.Series
         External arithmetic mean fluid temperature of chilled water at
         heat exchanger (evaporater) [K]
 
@@ -45,8 +69,11 @@ def calc_characteristic_temp(t_hot, t_cool, t_chill, coef_a, coef_e, method):
 
     Returns
     -------
-    ddts : numeric
-        Characteristic temperature difference [K]
+    ddts : list, numpy.ndarray or pandas.Series
+        Characteristic temperature difference [K]. A pandas.Series (with
+        the index of the first Series input) if any temperature is a Series,
+        a numpy.ndarray if any is an array, a list if any is a list and a
+        single value otherwise.
 
 
     **Reference**
@@ -72,57 +99,16 @@ def calc_characteristic_temp(t_hot, t_cool, t_chill, coef_a, coef_e, method):
     In: International Journal of Refrigeration, 33 (2010) 70-78.
     """
 
-    if not isinstance(t_hot, (list)):
-        raise TypeError("Argument 't_hot' is not of " "type list!")
-    if not isinstance(t_cool, (list)):
-        raise TypeError("Argument 't_cool' is not of " "type list!")
-    if not isinstance(t_chill, (list)):
-        raise TypeError("Argument 't_chill' is not of " "type list!")
-
-    lengths = [len(t_hot), len(t_cool), len(t_chill)]
-    length = max(lengths)
-
-    # External mean temperature at generator (g)
-    if len(t_hot) == 1:
-        list_t_g = t_hot * length
-    elif len(t_hot) == length:
-        list_t_g = t_hot
-    else:
-        raise ValueError(
-            "Length of argument 't_hot' does not to match requirements"
-        )
-
-    # External mean temperature at absorber/condenser (ac)
-    if len(t_cool) == 1:
-        list_t_ac = t_cool * length
-    elif len(t_cool) == length:
-        list_t_ac = t_cool
-    else:
-        raise ValueError(
-            "Length of argument 't_cool' does not to match requirements"
-        )
-
-    # External mean temperature at evaporator (e)
-    if len(t_chill) == 1:
-        list_t_e = t_chill * length
-    elif len(t_chill) == length:
-        list_t_e = t_chill
-    else:
-        raise ValueError(
-            "Length of argument 't_chill' does not to match requirements"
-        )
+    t_g, t_ac, t_e = _temperature_arrays(t_hot, t_cool, t_chill)
 
     if method == "kuehn_and_ziegler":
-        ddts = [
-            t_g - coef_a * t_ac + coef_e * t_e
-            for t_g, t_ac, t_e in zip(list_t_g, list_t_ac, list_t_e)
-        ]
+        ddts = _characteristic_temp(t_g, t_ac, t_e, coef_a, coef_e)
     else:
         raise ValueError(
             "Unrecognized input for argument 'method'. "
             "Possible options: 'kuehn_and_ziegler'."
         )
-    return ddts
+    return like_input(np.atleast_1d(ddts), t_hot, t_cool, t_chill)
 
 
 def calc_heat_flux(ddts, coef_s, coef_r, method):
@@ -135,7 +121,7 @@ def calc_heat_flux(ddts, coef_s, coef_r, method):
 
     Parameters
     ----------
-    ddt : numeric
+    ddts : numeric, list, numpy.ndarray or pandas.Series
         Characteristic temperature difference [K]
 
     coeff_s : numeric
@@ -149,21 +135,21 @@ def calc_heat_flux(ddts, coef_s, coef_r, method):
 
     Returns
     -------
-    Q_dots : numeric
-        Heat flux [W]
+    Q_dots : list, numpy.ndarray or pandas.Series
+        Heat flux [W] in the container type of `ddts`
 
     """
     if method == "kuehn_and_ziegler":
-        Q_dots = [coef_s * ddt + coef_r for ddt in ddts]
+        Q_dots = coef_s * np.asarray(ddts, dtype=float) + coef_r
     else:
         raise ValueError(
             "Unrecognized input for argument 'method'. "
             "Possible options: 'kuehn_and_ziegler'."
         )
-    return Q_dots
+    return like_input(np.atleast_1d(Q_dots), ddts)
 
 
-def define_AC_specs(Q_dots_evap, Q_dots_gen):
+def define_AC_specs(Q_dots_evap, Q_dots_gen, out=None):
     r"""
     Calculates the coefficients of performance ('COPs'),
     the maximum chiller capacity as normed value ('Q_chill_max'),
@@ -185,22 +171,399 @@ def define_AC_specs(Q_dots_evap, Q_dots_gen):
 
     Parameters
     ----------
-    Q_dots_evap : numeric
+    Q_dots_evap : list, numpy.ndarray or pandas.Series of numeric
         Heat flux at Evaporator
 
-    Q_dots_gen : numeric
+    Q_dots_gen : list, numpy.ndarray or pandas.Series of numeric
         Heat flux at Generator
 
+    out : dict (optional)
+        Preallocated numpy.ndarrays of matching length for the keys
+        'COPs' and 'Q_chill_max'. If given, the results are written into
+        these buffers and the buffers are returned, which allows to reuse
+        memory when evaluating many chillers.
+
     Returns
     -------
     AC_specs : dict
         Absorption chiller specifications
-        ('COPs', 'Q_chill_max', 'Q_chill_nominal')
+        ('COPs', 'Q_chill_max', 'Q_chill_nominal'). Without `out`,
+        'COPs' and 'Q_chill_max' are pandas.Series if an input is a Series,
+        numpy.ndarrays if an input is an array and lists for list input.
+        With `out` they are the given buffers. 'Q_chill_nominal' is a
+        single value.
 
     """
+    array_Q_dots_evap = np.asarray(Q_dots_evap, dtype=float)
+    array_Q_dots_gen = np.asarray(Q_dots_gen, dtype=float)
+
+    if array_Q_dots_evap.shape != array_Q_dots_gen.shape:
+        raise ValueError(
+            "Arguments 'Q_dots_evap' and 'Q_dots_gen' "
+            "have to be of same length!"
+        )
+
+    # The maximum is evaluated only once for the whole time series
+    Q_chill_nominal = array_Q_dots_evap.max()
+
+    if out is None:
+        COPs = like_input(
+            array_Q_dots_evap / array_Q_dots_gen, Q_dots_evap, Q_dots_gen
+        )
+        Q_chill_max = like_input(
+            array_Q_dots_evap / Q_chill_nominal, Q_dots_evap, Q_dots_gen
+        )
+    else:
+        COPs = np.divide(array_Q_dots_evap, array_Q_dots_gen, out=out["COPs"])
+        Q_chill_max = np.divide(
+            array_Q_dots_evap, Q_chill_nominal, out=out["Q_chill_max"]
+        )
+
     AC_specs = {
-        "COPs": [Q_e / Q_g for Q_e, Q_g in zip(Q_dots_evap, Q_dots_gen)],
-        "Q_chill_max": [Q_e / max(Q_dots_evap) for Q_e in Q_dots_evap],
-        "Q_chill_nominal": max(Q_dots_evap),
+        "COPs": COPs,
+        "Q_chill_max": Q_chill_max,
+        "Q_chill_nominal": float(Q_chill_nominal),
     }
     return AC_specs
+
+
+def calc_chiller_operation(
+    t_hot,
+    t_cool,
+    t_chill,
+    parameters,
+    method="kuehn_and_ziegler",
+    nominal_Q_dot_evap=None,
+):
+    r"""
+    Calculates the characteristic temperature difference, the heat fluxes,
+    the COPs and the normed cooling capacity of an absorption chiller in one
+    vectorised pass.
+
+    This combines :func:`calc_characteristic_temp`, :func:`calc_heat_flux`
+    (for evaporator and generator) and :func:`define_AC_specs`. The results
+    can be used directly as `max` of the chilled water
+    :class:`oemof.solph.Flow` and as conversion factors.
+
+    .. calc_chiller_operation-equations:
+
+    :math:`COP = \frac{\dot{Q}_{E}}{\dot{Q}_{G}}`
+
+    :math:`\dot{Q}_{chill, max} = \frac{\dot{Q}_{E}}
+    {\dot{Q}_{E, nominal}}`
+
+    Parameters
+    ----------
+    t_hot, t_cool, t_chill : numeric, list, numpy.ndarray or pandas.Series
+        External arithmetic mean fluid temperatures at generator,
+        absorber/condenser and evaporator. Inputs are broadcast against
+        each other.
+
+    parameters : CharacteristicParameters or dict
+        Characteristic parameters 'a', 'e', 's_E', 'r_E', 's_G' and 'r_G' of
+        the chiller, e.g. from :func:`load_characteristic_parameters`.
+
+    method : string
+        Method to calculate characteristic temperature difference
+
+    nominal_Q_dot_evap : numeric (optional)
+        Nominal cooling capacity used to norm the cooling capacity. Default:
+        maximum of the cooling capacity.
+
+    Returns
+    -------
+    operation : dict
+        'ddts', 'Q_dots_evap', 'Q_dots_gen', 'COPs' and 'Q_chill_max' as
+        aligned numpy.ndarrays (pandas.Series with the index of the first
+        Series input, if any) and 'Q_chill_nominal'.
+    """
+    if method != "kuehn_and_ziegler":
+        raise ValueError(
+            "Unrecognized input for argument 'method'. "
+            "Possible options: 'kuehn_and_ziegler'."
+        )
+
+    if isinstance(parameters, Mapping):
+        parameters = CharacteristicParameters(
+            name=None,
+            id=None,
+            **{
+                field: parameters[field]
+                for field in CharacteristicParameters._fields[2:]
+            },
+        )
+
+    ddts = _characteristic_temp(
+        *_temperature_arrays(t_hot, t_cool, t_chill),
+        parameters.a,
+        parameters.e,
+    ).reshape(-1)
+    Q_dots_evap = parameters.s_E * ddts + parameters.r_E
+    Q_dots_gen = parameters.s_G * ddts + parameters.r_G
+
+    if nominal_Q_dot_evap is None:
+        nominal_Q_dot_evap = Q_dots_evap.max()
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        COPs = Q_dots_evap / Q_dots_gen
+
+    operation = {
+        "ddts": ddts,
+        "Q_dots_evap": Q_dots_evap,
+        "Q_dots_gen": Q_dots_gen,
+        "COPs": COPs,
+        "Q_chill_max": Q_dots_evap / nominal_Q_dot_evap,
+    }
+
+    index = series_index(len(ddts), t_hot, t_cool, t_chill)
+    if index is not None:
+        operation = {
+            key: pd.Series(value, index=index)
+            for key, value in operation.items()
+        }
+    operation["Q_chill_nominal"] = float(nominal_Q_dot_evap)
+    return operation
+
+
+def calc_library_operation(
+    t_hot, t_cool, t_chill, parameters, method="kuehn_and_ziegler"
+):
+    r"""
+    Evaluates many absorption chillers against the same temperatures in one
+    broadcast computation.
+
+    The characteristic parameters of all chillers are arranged as column
+    vectors and broadcast against the temperature time series, which gives
+    (chillers x timesteps) matrices without a Python loop over the chillers.
+    The equations are the ones of :func:`calc_characteristic_temp`,
+    :func:`calc_heat_flux` and :func:`define_AC_specs`.
+
+    Parameters
+    ----------
+    t_hot, t_cool, t_chill : numeric, list, numpy.ndarray or pandas.Series
+        External arithmetic mean fluid temperatures at generator,
+        absorber/condenser and evaporator. Inputs are broadcast against
+        each other.
+
+    parameters : ChillerLibrary, pandas.DataFrame or iterable of \
+    CharacteristicParameters
+        Characteristic parameters of the chillers. A DataFrame needs the
+        columns 'a', 'e', 's_E', 'r_E', 's_G' and 'r_G' and is labelled by
+        its column 'name' (if present) or by its index.
+
+    method : string
+        Method to calculate characteristic temperature difference
+
+    Returns
+    -------
+    operation : dict
+        'ddts', 'Q_dots_evap', 'Q_dots_gen' and 'COPs' as pandas.DataFrames
+        with one row per chiller and one column per timestep. The columns
+        are the index of the first Series input, if any.
+    """
+    t_g, t_ac, t_e = _temperature_arrays(t_hot, t_cool, t_chill)
+    if method != "kuehn_and_ziegler":
+        raise ValueError(
+            "Unrecognized input for argument 'method'. "
+            "Possible options: 'kuehn_and_ziegler'."
+        )
+
+    names, coefs = _parameter_columns(parameters)
+    ddts = _characteristic_temp(
+        np.atleast_1d(t_g),
+        np.atleast_1d(t_ac),
+        np.atleast_1d(t_e),
+        coefs["a"],
+        coefs["e"],
+    )
+    Q_dots_evap = coefs["s_E"] * ddts + coefs["r_E"]
+    Q_dots_gen = coefs["s_G"] * ddts + coefs["r_G"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        COPs = Q_dots_evap / Q_dots_gen
+
+    index = pd.Index(names, name="chiller")
+    columns = series_index(ddts.shape[1], t_hot, t_cool, t_chill)
+    return {
+        key: pd.DataFrame(value, index=index, columns=columns)
+        for key, value in [
+            ("ddts", ddts),
+            ("Q_dots_evap", Q_dots_evap),
+            ("Q_dots_gen", Q_dots_gen),
+            ("COPs", COPs),
+        ]
+    }
+
+
+def _parameter_columns(parameters):
+    r"""
+    Returns the names of the chillers and their characteristic parameters
+    as column vectors of shape (chillers, 1).
+    """
+    fields = CharacteristicParameters._fields[2:]
+    if isinstance(parameters, pd.DataFrame):
+        missing = set(fields) - set(parameters.columns)
+        if missing:
+            raise KeyError(
+                f"Columns {sorted(missing)} are missing in the table of "
+                "characteristic parameters."
+            )
+        if "name" in parameters.columns:
+            names = parameters["name"].tolist()
+        else:
+            names = parameters.index.tolist()
+        columns = {field: parameters[field] for field in fields}
+    else:
+        if isinstance(parameters, Mapping):
+            parameters = parameters.values()
+        records = list(parameters)
+        names = [rec.name for rec in records]
+        columns = {
+            field: [getattr(rec, field) for rec in records] for field in fields
+        }
+    coefs = {
+        field: np.asarray(values, dtype=float).reshape(-1, 1)
+        for field, values in columns.items()
+    }
+    return names, coefs
+
+
+def _temperature_arrays(t_hot, t_cool, t_chill):
+    r"""
+    Returns the temperatures at generator, absorber/condenser and evaporator
+    as 1-D (or 0-D) numpy.ndarrays of broadcastable lengths.
+    """
+    temps = {"t_hot": t_hot, "t_cool": t_cool, "t_chill": t_chill}
+    for name, temp in temps.items():
+        if not isinstance(temp, (numbers.Number, list, np.ndarray, pd.Series)):
+            raise TypeError(
+                f"Argument '{name}' is not of type numeric, list, "
+                "numpy.ndarray or pandas.Series!"
+            )
+
+    # Length-1 inputs are broadcast by NumPy without replicating them
+    arrays = {
+        name: np.asarray(temp, dtype=float) for name, temp in temps.items()
+    }
+    length = max(array.size for array in arrays.values())
+    for name, array in arrays.items():
+        if array.ndim > 1 or array.size not in (1, length):
+            raise ValueError(
+                f"Length of argument '{name}' does not to match requirements"
+            )
+
+    return arrays["t_hot"], arrays["t_cool"], arrays["t_chill"]
+
+
+def _characteristic_temp(t_g, t_ac, t_e, coef_a, coef_e):
+    r"""
+    Evaluates the characteristic temperature difference by Kühn and Ziegler
+    on (broadcastable) arrays.
+    """
+    return t_g - coef_a * t_ac + coef_e * t_e
+
+
+class ChillerLibrary(Mapping):
+    r"""
+    Immutable library of characteristic parameters of absorption chillers.
+
+    The library is a read-only mapping from the chiller name to its
+    :class:`CharacteristicParameters` (a, e, s_E, r_E, s_G, r_G). Chillers
+    can also be looked up by their id with :meth:`by_id`. Both lookups are
+    dictionary accesses.
+
+    Parameters
+    ----------
+    table : pandas.DataFrame
+        Table with the columns 'name', 'id', 'a', 'e', 's_E', 'r_E', 's_G'
+        and 'r_G' (e.g. read from 'characteristic_parameters.csv').
+
+    Examples
+    --------
+    >>> library = load_characteristic_parameters(
+    ...     'data/characteristic_parameters.csv')  # doctest: +SKIP
+    >>> kuehn = library['Kuehn']  # doctest: +SKIP
+    >>> kuehn.a, kuehn.s_E  # doctest: +SKIP
+    (2.5, 0.42)
+    """
+
+    def __init__(self, table):
+        missing = set(CharacteristicParameters._fields) - set(table.columns)
+        if missing:
+            raise KeyError(
+                f"Columns {sorted(missing)} are missing in the table of "
+                "characteristic parameters."
+            )
+        records = [
+            CharacteristicParameters(
+                name=str(row["name"]),
+                id=int(row["id"]),
+                **{
+                    field: float(row[field])
+                    for field in CharacteristicParameters._fields[2:]
+                },
+            )
+            for row in table.to_dict("records")
+        ]
+        self._by_name = MappingProxyType({rec.name: rec for rec in records})
+        self._by_id = MappingProxyType({rec.id: rec for rec in records})
+
+    def __getitem__(self, name):
+        return self._by_name[name]
+
+    def __iter__(self):
+        return iter(self._by_name)
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def by_id(self, chiller_id):
+        r"""Returns the characteristic parameters of the chiller `chiller_id`."""
+        return self._by_id[chiller_id]
+
+
+def load_characteristic_parameters(filename):
+    r"""
+    Returns the :class:`ChillerLibrary` of a csv file of characteristic
+    parameters.
+
+    The file is read only once; subsequent calls return the same library
+    from a module level cache. Use :func:`reload_characteristic_parameters`
+    after changing the file.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the csv file (e.g. 'characteristic_parameters.csv' of the
+        examples).
+
+    Returns
+    -------
+    library : ChillerLibrary
+        Characteristic parameters keyed by chiller name.
+    """
+    key = os.path.abspath(filename)
+    if key not in _libraries:
+        _libraries[key] = ChillerLibrary(pd.read_csv(key))
+    return _libraries[key]
+
+
+def reload_characteristic_parameters(filename=None):
+    r"""
+    Clears the cache of :func:`load_characteristic_parameters`.
+
+    Parameters
+    ----------
+    filename : str (optional)
+        If given, only this file is dropped from the cache and reloaded.
+        Otherwise the whole cache is cleared.
+
+    Returns
+    -------
+    library : ChillerLibrary or None
+        The reloaded library if `filename` is given.
+    """
+    if filename is None:
+        _libraries.clear()
+        return None
+    _libraries.pop(os.path.abspath(filename), None)
+    return load_characteristic_parameters(filename)
@@ -12,6 +12,9 @@ oemof-thermal/src/oemof/thermal/chp.py
 SPDX-License-Identifier: MIT
 """
 
+import numpy as np
+import pandas as pd
+
 
 def allocate_emissions(total_emissions, eta_el, eta_th, method, **kwargs):
     r"""
@@ -123,3 +126,270 @@ def allocate_emissions(total_emissions, eta_el, eta_th, method, **kwargs):
         )
 
     return allocated_emissions_electricity, allocated_emissions_heat
+
+
+def allocate_emissions_portfolio(
+    total_emissions, eta_el, eta_th, method, eta_el_ref=None, eta_th_ref=None
+):
+    r"""
+    Allocates the emissions of a portfolio of cogeneration plants to
+    electrical energy and heat, each plant with its own method.
+
+    The plants are grouped by their method and every group is allocated in
+    one vectorised call of :func:`allocate_emissions`, so the number of
+    Python level calls does not depend on the number of plants or
+    timesteps.
+
+    Parameters
+    ----------
+    total_emissions : pandas.DataFrame or 2-D array-like
+        Total absolute emissions with one row per plant and one column per
+        timestep [in CO2 equivalents].
+
+    eta_el : numeric, 1-D or 2-D array-like
+        Electrical efficiency of the plants [-]. 1-D inputs (e.g. a
+        pandas.Series indexed by plant) hold one value per plant, 2-D
+        inputs one value per plant and timestep.
+
+    eta_th : numeric, 1-D or 2-D array-like
+        Thermal efficiency of the plants [-], shaped as `eta_el`.
+
+    method : str or 1-D array-like of str
+        Allocation method per plant, e.g. the 'method' column of a table of
+        plants. Choose from ['iea', finnish', 'efficiency']. A
+        pandas.Series is aligned with the index of a DataFrame
+        `total_emissions`; plants without a method raise a ValueError.
+
+    eta_el_ref, eta_th_ref : numeric, 1-D or 2-D array-like (optional)
+        Reference efficiencies, shaped as `eta_el`. Required if any plant
+        uses the finnish method.
+
+    Returns
+    -------
+    allocated_emissions_electricity : pandas.DataFrame or numpy.ndarray
+        Emissions allocated to electricity, aligned with `total_emissions`
+        [in CO2 equivalents].
+
+    allocated_emissions_heat : pandas.DataFrame or numpy.ndarray
+        Emissions allocated to heat, aligned with `total_emissions`
+        [in CO2 equivalents].
+    """
+    emissions = np.asarray(total_emissions, dtype=float)
+    if emissions.ndim != 2:
+        raise ValueError(
+            "Argument 'total_emissions' has to be two-dimensional "
+            "(plants x timesteps)."
+        )
+    if isinstance(method, pd.Series) and isinstance(
+        total_emissions, pd.DataFrame
+    ):
+        method = method.reindex(total_emissions.index)
+    methods = np.broadcast_to(
+        np.asarray(method, dtype=object), emissions.shape[:1]
+    )
+    invalid = [
+        plant
+        for plant, name in zip(_plants(total_emissions), methods)
+        if not isinstance(name, str)
+    ]
+    if invalid:
+        raise ValueError(
+            f"No allocation method given for the plants {invalid}."
+        )
+
+    efficiencies = {
+        "eta_el": eta_el,
+        "eta_th": eta_th,
+        "eta_el_ref": eta_el_ref,
+        "eta_th_ref": eta_th_ref,
+    }
+    efficiencies = {
+        name: _per_plant(value, total_emissions, name)
+        for name, value in efficiencies.items()
+        if value is not None
+    }
+
+    allocated_el = np.empty_like(emissions)
+    allocated_th = np.empty_like(emissions)
+    for name in np.unique(methods):
+        rows = np.flatnonzero(methods == name)
+        allocated_el[rows], allocated_th[rows] = allocate_emissions(
+            emissions[rows],
+            method=name,
+            **{key: value[rows] for key, value in efficiencies.items()},
+        )
+
+    if isinstance(total_emissions, pd.DataFrame):
+        allocated_el = pd.DataFrame(
+            allocated_el,
+            index=total_emissions.index,
+            columns=total_emissions.columns,
+        )
+        allocated_th = pd.DataFrame(
+            allocated_th,
+            index=total_emissions.index,
+            columns=total_emissions.columns,
+        )
+    return allocated_el, allocated_th
+
+
+def allocate_emissions_from_results(results, chps):
+    r"""
+    Allocates the emissions of the cogeneration plants of a solved
+    oemof.solph model to electrical energy and heat.
+
+    The fuel, electricity and heat flows of all plants are collected in one
+    pass over the results and stacked to (plants x timesteps) arrays. The
+    total emissions are the fuel input times the emission factor, the
+    efficiencies the ratio of the outputs to the fuel input. The allocation
+    itself is done by :func:`allocate_emissions_portfolio`. Timesteps
+    without fuel input get no emissions.
+
+    Parameters
+    ----------
+    results : dict
+        Results of :func:`oemof.solph.processing.results`, keyed by
+        (node, node) tuples, each holding a 'sequences' DataFrame with a
+        'flow' column.
+
+    chps : dict
+        Mapping of the cogeneration converters (nodes or labels) to a dict
+        with the keys
+
+        * 'emission_factor': Emissions per unit of fuel input
+          [in CO2 equivalents].
+        * 'electricity_bus': Electricity bus (node or label).
+        * 'heat_bus': Heat bus (node or label).
+        * 'method': Allocation method, see :func:`allocate_emissions`.
+        * 'eta_el_ref', 'eta_th_ref': Reference efficiencies (finnish
+          method only).
+
+        All inputs of a converter are considered as fuel.
+
+    Returns
+    -------
+    allocation : pandas.DataFrame
+        Tidy DataFrame with one row per plant and timestep (index levels
+        'chp' and 'timestep') and the columns 'fuel', 'electricity', 'heat',
+        'total_emissions', 'emissions_electricity' and 'emissions_heat'.
+    """
+    specs = {_label(chp): spec for chp, spec in chps.items()}
+    outputs = {
+        label: {
+            _label(spec["electricity_bus"]): "electricity",
+            _label(spec["heat_bus"]): "heat",
+        }
+        for label, spec in specs.items()
+    }
+
+    flows = {label: {} for label in specs}
+    fuel = {label: [] for label in specs}
+    for (node_from, node_to), data in results.items():
+        source, target = _label(node_from), _label(node_to)
+        if target in specs:
+            fuel[target].append(data["sequences"]["flow"])
+        elif source in specs and target in outputs[source]:
+            flows[source][outputs[source][target]] = data["sequences"]["flow"]
+
+    for label, spec in specs.items():
+        if spec["method"] == "finnish" and not spec.keys() >= {
+            "eta_el_ref",
+            "eta_th_ref",
+        }:
+            raise ValueError(
+                "Must specify eta_el_ref, eta_th_ref for cogeneration plant "
+                f"'{label}' when using finnish method."
+            )
+
+    for label in specs:
+        missing = {"electricity", "heat"} - set(flows[label])
+        if not fuel[label] or missing:
+            raise KeyError(
+                f"Flows of cogeneration plant '{label}' are missing in the "
+                "results."
+            )
+
+    timeindex = flows[next(iter(specs))]["electricity"].index
+    fuel = np.array([np.sum(fuel[label], axis=0) for label in specs])
+    electricity = np.array([flows[label]["electricity"] for label in specs])
+    heat = np.array([flows[label]["heat"] for label in specs])
+    emission_factor = np.array(
+        [specs[label]["emission_factor"] for label in specs], dtype=float
+    )
+    total_emissions = emission_factor[:, np.newaxis] * fuel
+
+    references = {
+        name: np.array(
+            [specs[label].get(name, np.nan) for label in specs], dtype=float
+        )
+        for name in ["eta_el_ref", "eta_th_ref"]
+        if any(name in spec for spec in specs.values())
+    }
+
+    burning = fuel > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta_el = np.where(burning, electricity / fuel, 0.0)
+        eta_th = np.where(burning, heat / fuel, 0.0)
+        emissions_el, emissions_th = allocate_emissions_portfolio(
+            total_emissions,
+            eta_el,
+            eta_th,
+            method=[specs[label]["method"] for label in specs],
+            **references,
+        )
+    emissions_el = np.where(burning, emissions_el, 0.0)
+    emissions_th = np.where(burning, emissions_th, 0.0)
+
+    index = pd.MultiIndex.from_product(
+        [list(specs), timeindex], names=["chp", "timestep"]
+    )
+    return pd.DataFrame(
+        {
+            "fuel": fuel.ravel(),
+            "electricity": electricity.ravel(),
+            "heat": heat.ravel(),
+            "total_emissions": total_emissions.ravel(),
+            "emissions_electricity": emissions_el.ravel(),
+            "emissions_heat": emissions_th.ravel(),
+        },
+        index=index,
+    )
+
+
+def _label(node):
+    r"""Returns the label of an oemof node or the label itself."""
+    return getattr(node, "label", node)
+
+
+def _plants(total_emissions):
+    r"""Returns the plant labels of the rows of `total_emissions`."""
+    if isinstance(total_emissions, pd.DataFrame):
+        return total_emissions.index
+    return range(len(total_emissions))
+
+
+def _per_plant(value, total_emissions, name):
+    r"""
+    Returns `value` as array of the shape of `total_emissions`.
+
+    pandas objects are aligned with the plants (and timesteps) of a
+    DataFrame `total_emissions` first. 1-D inputs hold one value per plant.
+    """
+    if isinstance(total_emissions, pd.DataFrame):
+        if isinstance(value, pd.DataFrame):
+            value = value.reindex(
+                index=total_emissions.index, columns=total_emissions.columns
+            )
+        elif isinstance(value, pd.Series):
+            value = value.reindex(total_emissions.index)
+    array = np.asarray(value, dtype=float)
+    shape = np.shape(total_emissions)
+    if array.ndim == 1:
+        array = array.reshape(-1, 1)
+    try:
+        return np.broadcast_to(array, shape)
+    except ValueError:
+        raise ValueError(
+            f"Argument '{name}' does not match the shape {shape} of "
+            "'total_emissions'."
+        ) from None
@@ -11,8 +11,13 @@ oemof-thermal/src/oemof/thermal/compression_heatpumps_and_chillers.py
 
 SPDX-License-Identifier: MIT
 """
+import numbers
+
+import numpy as np
 import pandas as pd
 
+from oemof.thermal._helpers import like_input
+
 
 def calc_cops(
     mode,
@@ -49,9 +54,9 @@ def calc_cops(
 
     Parameters
     ----------
-    temp_high : list or pandas.Series of numerical values
+    temp_high : numerical value, list, numpy.ndarray or pandas.Series
         Temperature of the high temperature reservoir in :math:`^\circ C`
-    temp_low : list or pandas.Series of numerical values
+    temp_low : numerical value, list, numpy.ndarray or pandas.Series
         Temperature of the low temperature reservoir in :math:`^\circ C`
     quality_grade : numerical value
         Factor that scales down the efficiency of the real heat pump
@@ -68,78 +73,337 @@ def calc_cops(
 
     Returns
     -------
-    cops : list of numerical values
-        List of Coefficients of Performance (COPs)
+    cops : numerical value, list, numpy.ndarray or pandas.Series
+        Coefficients of Performance (COPs). The container type follows the
+        temperature inputs: a pandas.Series (keeping its index) if one of
+        them is a Series, otherwise a numpy.ndarray, a list or a single
+        value.
 
 
     """
     # Check if input arguments have proper type and length
-    if not isinstance(temp_low, (list, pd.Series)):
+    if not isinstance(temp_low, (numbers.Number, list, np.ndarray, pd.Series)):
         raise TypeError(
-            "Argument 'temp_low' is not of type list or pd.Series!"
+            "Argument 'temp_low' is not of type numeric, list, "
+            "np.ndarray or pd.Series!"
         )
 
-    if not isinstance(temp_high, (list, pd.Series)):
+    if not isinstance(
+        temp_high, (numbers.Number, list, np.ndarray, pd.Series)
+    ):
         raise TypeError(
-            "Argument 'temp_high' is not of " "type list or pd.Series!"
+            "Argument 'temp_high' is not of type numeric, list, "
+            "np.ndarray or pd.Series!"
         )
 
-    if len(temp_high) != len(temp_low):
-        if (len(temp_high) != 1) and ((len(temp_low) != 1)):
+    array_temp_high = np.asarray(temp_high, dtype=float)
+    array_temp_low = np.asarray(temp_low, dtype=float)
+
+    if array_temp_high.size != array_temp_low.size:
+        if (array_temp_high.size != 1) and (array_temp_low.size != 1):
             raise IndexError(
                 "Arguments 'temp_low' and 'temp_high' "
                 "have to be of same length or one has "
                 "to be of length 1 !"
             )
 
-    # if factor_icing is not None and consider_icing is False:
-    #     raise ValueError('Argument factor_icing can not be used without '
-    #                      'setting consider_icing=True!')
-    #
-    # if factor_icing is None and consider_icing is True:
-    #     raise ValueError('Icing cannot be considered because argument '
-    #                      'factor_icing has value None!')
-
-    # Make temp_low and temp_high have the same length and
-    # convert unit to Kelvin.
-    length = max([len(temp_high), len(temp_low)])
-    if len(temp_high) == 1:
-        list_temp_high_K = [temp_high[0] + 273.15] * length
-    else:  # len(temp_high) == length:
-        list_temp_high_K = [t + 273.15 for t in temp_high]
-    if len(temp_low) == 1:
-        list_temp_low_K = [temp_low[0] + 273.15] * length
-    else:  # len(temp_low) == length:
-        list_temp_low_K = [t + 273.15 for t in temp_low]
-
-    # Calculate COPs depending on selected mode (without icing).
+    if mode not in ["heat_pump", "chiller"]:
+        raise ValueError(
+            "Unrecognized input for argument 'mode'. "
+            "Possible options: 'heat_pump' or 'chiller'."
+        )
+
+    if factor_icing is not None and mode == "chiller":
+        raise ValueError(
+            "Argument 'factor_icing' has " "to be None for mode='chiller'!"
+        )
+
+    # Convert unit to Kelvin. Arrays of length 1 broadcast against the
+    # other temperature, so no replicated copies are created.
+    temp_high_K = array_temp_high.reshape(-1) + 273.15
+    temp_low_K = array_temp_low.reshape(-1) + 273.15
+
+    cops = _carnot_cops(
+        mode,
+        temp_high_K,
+        temp_low_K,
+        quality_grade,
+        temp_threshold_icing,
+        factor_icing,
+    )
+    return like_input(cops, temp_high, temp_low)
+
+
+def calc_cops_fleet(
+    mode,
+    temp_high,
+    temp_low,
+    quality_grade,
+    temp_threshold_icing=2,
+    factor_icing=None,
+):
+    r"""
+    Calculates the Coefficients of Performance (COPs) of a fleet of heat
+    pumps or chillers in one broadcast pass.
+
+    See :func:`calc_cops` for the equations. Every unit may have its own
+    parameters and temperatures.
+
+    Parameters
+    ----------
+    temp_high : numerical value or array-like
+        Temperature of the high temperature reservoir in :math:`^\circ C`.
+        A 1-D array is a time series shared by all units, per unit values
+        have the shape (units, 1) and per unit time series the shape
+        (units, timesteps).
+    temp_low : numerical value or array-like
+        Temperature of the low temperature reservoir in :math:`^\circ C`.
+        Shapes as for `temp_high`.
+    quality_grade : numerical value or 1-D array-like
+        Quality grade per unit.
+    temp_threshold_icing : numerical value or 1-D array-like
+        Icing threshold temperature in :math:`^\circ C` per unit
+        (default 2).
+    factor_icing : numerical value or 1-D array-like
+        Relative COP drop caused by icing per unit. Use 1 for units without
+        icing (default None: no icing for all units).
+    mode : string
+        Two possible modes: "heat_pump" or "chiller"
+
+    Returns
+    -------
+    cops : numpy.ndarray
+        COPs with the shape (units, timesteps).
+
+    """
+    if mode not in ["heat_pump", "chiller"]:
+        raise ValueError(
+            "Unrecognized input for argument 'mode'. "
+            "Possible options: 'heat_pump' or 'chiller'."
+        )
+
+    if factor_icing is not None and mode == "chiller":
+        raise ValueError(
+            "Argument 'factor_icing' has " "to be None for mode='chiller'!"
+        )
+
+    cops = _carnot_cops(
+        mode,
+        np.asarray(temp_high, dtype=float) + 273.15,
+        np.asarray(temp_low, dtype=float) + 273.15,
+        _per_unit(quality_grade),
+        _per_unit(temp_threshold_icing),
+        None if factor_icing is None else _per_unit(factor_icing),
+    )
+    return np.atleast_2d(cops)
+
+
+def _per_unit(value):
+    r"""
+    Returns a per unit parameter as column vector, so that it broadcasts
+    along the time axis.
+    """
+    value = np.asarray(value, dtype=float)
+    if value.ndim == 1:
+        return value[:, np.newaxis]
+    return value
+
+
+def _carnot_cops(
+    mode,
+    temp_high_K,
+    temp_low_K,
+    quality_grade,
+    temp_threshold_icing,
+    factor_icing,
+):
+    r"""
+    Evaluates the COPs on (broadcastable) arrays of temperatures in Kelvin.
+    """
+    # Scale the Carnot efficiency with the quality grade, lowered by the
+    # icing factor wherever the low temperature is below the threshold.
     if factor_icing is None:
-        if mode == "heat_pump":
-            cops = [
-                quality_grade * t_h / (t_h - t_l)
-                for t_h, t_l in zip(list_temp_high_K, list_temp_low_K)
-            ]
-        elif mode == "chiller":
-            cops = [
-                quality_grade * t_l / (t_h - t_l)
-                for t_h, t_l in zip(list_temp_high_K, list_temp_low_K)
-            ]
-
-    # Calculate COPs of a heat pump and lower COP when icing occurs.
-    elif factor_icing is not None:
-        if mode == "heat_pump":
-            cops = []
-            for t_h, t_l in zip(list_temp_high_K, list_temp_low_K):
-                if t_l < temp_threshold_icing + 273.15:
-                    f_icing = factor_icing
-                    cops = cops + [f_icing * quality_grade * t_h / (t_h - t_l)]
-                if t_l >= temp_threshold_icing + 273.15:
-                    cops = cops + [quality_grade * t_h / (t_h - t_l)]
-        elif mode == "chiller":
+        factor = quality_grade
+    else:
+        factor = np.where(
+            temp_low_K < temp_threshold_icing + 273.15,
+            factor_icing * quality_grade,
+            quality_grade,
+        )
+
+    if mode == "heat_pump":
+        return factor * temp_high_K / (temp_high_K - temp_low_K)
+    else:  # mode == "chiller"
+        return factor * temp_low_K / (temp_high_K - temp_low_K)
+
+
+class COPTable:
+    r"""
+    Lookup table of COPs over a grid of high and low temperatures.
+
+    The table is built once and answers COP queries for arbitrary arrays by
+    bilinear interpolation, which is much cheaper than repeated calls of
+    :func:`calc_cops` in scenario sweeps. Icing is not interpolated but
+    applied exactly to the interpolated values. Instances can be pickled to
+    share them with worker processes.
+
+    The interpolation error is bounded by
+
+    :math:`\vert COP - COP_\mathrm{table} \vert \leq f \cdot \eta
+    \cdot \frac{h_\mathrm{high}^2 \cdot T_\mathrm{low, max}
+    + h_\mathrm{low}^2 \cdot T_\mathrm{high, max}}
+    {4 \cdot (T_\mathrm{high, min} - T_\mathrm{low, max})^3}`
+
+    with the largest grid spacings :math:`h`, the temperatures in Kelvin and
+    :math:`f` the maximum of 1 and the icing factor. The bound is available
+    as attribute :attr:`error_bound`.
+
+    Parameters
+    ----------
+    mode : string
+        Two possible modes: "heat_pump" or "chiller"
+    quality_grade : numerical value
+        Quality grade, see :func:`calc_cops`.
+    temp_high : 1-D array-like
+        Ascending grid of high temperatures in :math:`^\circ C`.
+    temp_low : 1-D array-like
+        Ascending grid of low temperatures in :math:`^\circ C`. All
+        temperatures have to be below the lowest high temperature.
+    temp_threshold_icing : numerical value
+        Temperature in :math:`^\circ C` below which icing occurs (default 2)
+    factor_icing : numerical value
+        Relative COP drop caused by icing (default None: no icing).
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> table = COPTable(
+    ...     "heat_pump", 0.4, np.arange(30, 61, 1.0), np.arange(-20, 21, 1.0)
+    ... )
+    >>> cops = table(40, np.array([0.5, 10.3]))
+    """
+
+    def __init__(
+        self,
+        mode,
+        quality_grade,
+        temp_high,
+        temp_low,
+        temp_threshold_icing=2,
+        factor_icing=None,
+    ):
+        if mode not in ["heat_pump", "chiller"]:
+            raise ValueError(
+                "Unrecognized input for argument 'mode'. "
+                "Possible options: 'heat_pump' or 'chiller'."
+            )
+
+        if factor_icing is not None and mode == "chiller":
             raise ValueError(
                 "Argument 'factor_icing' has " "to be None for mode='chiller'!"
             )
-    return cops
+
+        self.temp_high = np.asarray(temp_high, dtype=float)
+        self.temp_low = np.asarray(temp_low, dtype=float)
+        for name, grid in [
+            ("temp_high", self.temp_high),
+            ("temp_low", self.temp_low),
+        ]:
+            if grid.ndim != 1 or grid.size < 2 or np.any(np.diff(grid) <= 0):
+                raise ValueError(
+                    f"Argument '{name}' has to be a strictly ascending grid "
+                    "of at least two temperatures!"
+                )
+
+        temp_difference_min = self.temp_high[0] - self.temp_low[-1]
+        if temp_difference_min <= 0:
+            raise ValueError(
+                "All temperatures of 'temp_low' have to be below the lowest "
+                "temperature of 'temp_high'!"
+            )
+
+        self.mode = mode
+        self.quality_grade = quality_grade
+        self.temp_threshold_icing = temp_threshold_icing
+        self.factor_icing = factor_icing
+
+        self.cops = _carnot_cops(
+            mode,
+            self.temp_high[:, np.newaxis] + 273.15,
+            self.temp_low[np.newaxis, :] + 273.15,
+            quality_grade,
+            temp_threshold_icing,
+            None,
+        )
+
+        h_high = np.diff(self.temp_high).max()
+        h_low = np.diff(self.temp_low).max()
+        self.error_bound = (
+            max(1, factor_icing or 1)
+            * quality_grade
+            * (
+                h_high**2 * (self.temp_low[-1] + 273.15)
+                + h_low**2 * (self.temp_high[-1] + 273.15)
+            )
+            / (4 * temp_difference_min**3)
+        )
+
+    def __call__(self, temp_high, temp_low):
+        r"""
+        Returns the interpolated COPs.
+
+        Parameters
+        ----------
+        temp_high : numerical value, list, numpy.ndarray or pandas.Series
+            Temperature of the high temperature reservoir in
+            :math:`^\circ C`
+        temp_low : numerical value, list, numpy.ndarray or pandas.Series
+            Temperature of the low temperature reservoir in
+            :math:`^\circ C`
+
+        Returns
+        -------
+        cops : numerical value, list, numpy.ndarray or pandas.Series
+            Coefficients of Performance (COPs) in the container type of the
+            inputs (see :func:`calc_cops`).
+        """
+        array_temp_high, array_temp_low = np.broadcast_arrays(
+            np.asarray(temp_high, dtype=float),
+            np.asarray(temp_low, dtype=float),
+        )
+        i, weight_high = _grid_position(self.temp_high, array_temp_high)
+        j, weight_low = _grid_position(self.temp_low, array_temp_low)
+
+        cops = (1 - weight_high) * (
+            (1 - weight_low) * self.cops[i, j]
+            + weight_low * self.cops[i, j + 1]
+        ) + weight_high * (
+            (1 - weight_low) * self.cops[i + 1, j]
+            + weight_low * self.cops[i + 1, j + 1]
+        )
+
+        if self.factor_icing is not None:
+            cops = np.where(
+                array_temp_low < self.temp_threshold_icing,
+                self.factor_icing * cops,
+                cops,
+            )
+        return like_input(cops.reshape(-1), temp_high, temp_low)
+
+
+def _grid_position(grid, values):
+    r"""
+    Returns the index of the grid cell and the relative position within the
+    cell for every value.
+    """
+    if np.any(values < grid[0]) or np.any(values > grid[-1]):
+        raise ValueError(
+            "Temperatures outside of the range of the COP table "
+            f"[{grid[0]}, {grid[-1]}]!"
+        )
+    index = np.clip(np.searchsorted(grid, values) - 1, 0, grid.size - 2)
+    weight = (values - grid[index]) / (grid[index + 1] - grid[index])
+    return index, weight
 
 
 def calc_max_Q_dot_chill(nominal_conditions, cops):
@@ -165,26 +429,30 @@ def calc_max_Q_dot_chill(nominal_conditions, cops):
         Dictionary describing one operating point (e.g., operation under STC)
         of the chiller by its
         cooling capacity, its electricity consumption and its COP
-        ('nominal_Q_chill', 'nominal_el_consumption' and 'nominal_cop')
-    cops : list of numerical values
-        Actual COP
+        ('nominal_Q_chill', 'nominal_el_consumption' and 'nominal_cop').
+        For a fleet, the values are arrays with one entry per unit.
+    cops : list, numpy.ndarray or pandas.Series of numerical values
+        Actual COP. For a fleet, an array of the shape (units, timesteps)
+        as returned by :func:`calc_cops_fleet`.
 
     Returns
     -------
-    max_Q_chill : list of numerical values
+    max_Q_chill : list, numpy.ndarray or pandas.Series of numerical values
         Maximal cooling capacity (relative value). Value is equal or greater
         than 0 and can be greater than 1.
 
 
     """
-    if not isinstance(cops, list):
-        raise TypeError("Argument 'cops' is not of type list!")
+    if not isinstance(cops, (list, np.ndarray, pd.Series)):
+        raise TypeError(
+            "Argument 'cops' is not of type list, np.ndarray or pd.Series!"
+        )
 
-    nominal_cop = (
-        nominal_conditions["nominal_Q_chill"]
-        / nominal_conditions["nominal_el_consumption"]
+    nominal_cop = np.divide(
+        nominal_conditions["nominal_Q_chill"],
+        nominal_conditions["nominal_el_consumption"],
     )
-    max_Q_chill = [actual_cop / nominal_cop for actual_cop in cops]
+    max_Q_chill = _relative_capacity(cops, nominal_cop)
     return max_Q_chill
 
 
@@ -213,25 +481,38 @@ def calc_max_Q_dot_heat(nominal_conditions, cops):
         Dictionary describing one operating point (e.g., operation
         under STC) of the heat pump by its
         heating capacity, its electricity consumption and its COP
-        ('nominal_Q_hot', 'nominal_el_consumption' and 'nominal_cop')
-    cops : list of numerical values
-        Actual COP
+        ('nominal_Q_hot', 'nominal_el_consumption' and 'nominal_cop').
+        For a fleet, the values are arrays with one entry per unit.
+    cops : list, numpy.ndarray or pandas.Series of numerical values
+        Actual COP. For a fleet, an array of the shape (units, timesteps)
+        as returned by :func:`calc_cops_fleet`.
 
     Returns
     -------
-    max_Q_hot : list of numerical values
+    max_Q_hot : list, numpy.ndarray or pandas.Series of numerical values
         Maximal heating capacity (relative value). Value is equal or
         greater than 0 and can be greater than 1.
 
     """
-    nominal_cop = (
-        nominal_conditions["nominal_Q_hot"]
-        / nominal_conditions["nominal_el_consumption"]
+    nominal_cop = np.divide(
+        nominal_conditions["nominal_Q_hot"],
+        nominal_conditions["nominal_el_consumption"],
     )
-    max_Q_hot = [actual_cop / nominal_cop for actual_cop in cops]
+    max_Q_hot = _relative_capacity(cops, nominal_cop)
     return max_Q_hot
 
 
+def _relative_capacity(cops, nominal_cop):
+    r"""
+    Divides the actual COPs by the nominal COP. For a fleet, the COPs have
+    the shape (units, timesteps) and the nominal COP the shape (units,).
+    """
+    array_cops = np.asarray(cops, dtype=float)
+    if array_cops.ndim == 2:
+        return array_cops / _per_unit(nominal_cop)
+    return like_input(array_cops / nominal_cop, cops)
+
+
 def calc_chiller_quality_grade(nominal_conditions):
     r"""
     Calculates the quality grade for a given point of operation.
@@ -18,6 +18,9 @@ import numpy as np
 import pandas as pd
 import pvlib
 
+from oemof.thermal._helpers import like_input
+from oemof.thermal.solar_position import get_solarposition
+
 
 def csp_precalc(
     lat,
@@ -51,13 +54,11 @@ def csp_precalc(
     :math:`Q_{coll} = E_{coll} \cdot \eta_C`
 
     functions used
-     * pvlib.solarposition.get_solarposition
+     * oemof.thermal.solar_position.get_solarposition
      * pvlib.tracking.singleaxis
      * calc_irradiance
-     * calc_collector_irradiance
      * calc_iam
-     * calc_eta_c
-     * calc_heat_coll
+     * calc_collector_output
 
     Parameters
     ----------
@@ -187,7 +188,7 @@ def csp_precalc(
     data = pd.DataFrame({"irradiance": irradiance, "t_amb": temp_amb})
 
     # Calculation of geometrical position of collector with the pvlib
-    solarposition = pvlib.solarposition.get_solarposition(
+    solarposition = get_solarposition(
         time=data.index, latitude=lat, longitude=long
     )
 
@@ -209,19 +210,16 @@ def csp_precalc(
         irradiance_method,
     )
 
-    # Calculation of the irradiance which reaches the collector after all
-    # losses (cleanliness)
-    collector_irradiance = calc_collector_irradiance(
-        irradiance_on_collector, cleanliness
-    )
-
     # Calculation of the incidence angle modifier
     iam = calc_iam(
         a_1, a_2, a_3, a_4, a_5, a_6, tracking_data["aoi"], loss_method
     )
 
-    # Calculation of the collectors efficiency
-    eta_c = calc_eta_c(
+    # Calculation of the irradiance which reaches the collector after all
+    # losses (cleanliness), the collectors efficiency and heat in one pass
+    collector_irradiance, eta_c, collector_heat = calc_collector_output(
+        irradiance_on_collector,
+        cleanliness,
         eta_0,
         c_1,
         c_2,
@@ -229,13 +227,9 @@ def csp_precalc(
         temp_collector_inlet,
         temp_collector_outlet,
         data["t_amb"],
-        collector_irradiance,
         loss_method,
     )
 
-    # Calculation of the collectors heat
-    collector_heat = calc_heat_coll(eta_c, collector_irradiance)
-
     # Writing the results in the output df
     data["collector_irradiance"] = collector_irradiance
     data["eta_c"] = eta_c
@@ -244,6 +238,93 @@ def csp_precalc(
     return data
 
 
+def csp_precalc_chunks(
+    lat,
+    long,
+    collector_tilt,
+    collector_azimuth,
+    cleanliness,
+    eta_0,
+    c_1,
+    c_2,
+    temp_collector_inlet,
+    temp_collector_outlet,
+    temp_amb,
+    a_1,
+    a_2,
+    a_3=0,
+    a_4=0,
+    a_5=0,
+    a_6=0,
+    loss_method="Janotte",
+    irradiance_method="horizontal",
+    chunk_size=8760,
+    **kwargs,
+):
+    r"""
+    Calculates collectors efficiency, irradiance and heat like
+    :func:`csp_precalc`, but processes the time index in windows of
+    `chunk_size` timesteps.
+
+    Only the data of one window is held in memory at once, so the peak memory
+    is bounded by `chunk_size` regardless of the length of the horizon.
+    Concatenating the yielded DataFrames gives the columns of
+    :func:`csp_precalc`.
+
+    Parameters
+    ----------
+    chunk_size: int, default 8760
+        Number of timesteps per window.
+
+    See :func:`csp_precalc` for the other parameters. Series arguments
+    (`temp_amb`, the irradiance and optionally the collector temperatures)
+    are sliced by position and have to share the same time index.
+
+    Yields
+    ------
+    data : pandas.DataFrame
+        Dataframe of one window containing the columns
+
+        * collector_irradiance
+        * eta_c
+        * collector_heat
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size has to be a positive integer")
+
+    for start in range(0, len(temp_amb), chunk_size):
+        window = slice(start, start + chunk_size)
+        data = csp_precalc(
+            lat,
+            long,
+            collector_tilt,
+            collector_azimuth,
+            cleanliness,
+            eta_0,
+            c_1,
+            c_2,
+            _window(temp_collector_inlet, window),
+            _window(temp_collector_outlet, window),
+            temp_amb.iloc[window],
+            a_1,
+            a_2,
+            a_3,
+            a_4,
+            a_5,
+            a_6,
+            loss_method=loss_method,
+            irradiance_method=irradiance_method,
+            **{key: _window(value, window) for key, value in kwargs.items()},
+        )
+        yield data[["collector_irradiance", "eta_c", "collector_heat"]]
+
+
+def _window(value, window):
+    if isinstance(value, pd.Series):
+        return value.iloc[window]
+    return value
+
+
 def calc_irradiance(
     surface_tilt,
     surface_azimuth,
@@ -323,11 +404,16 @@ def calc_collector_irradiance(irradiance_on_collector, cleanliness):
     collector_irradiance: series of numeric
         Irradiance on collector after all losses.
     """
-    collector_irradiance = irradiance_on_collector * cleanliness**1.5
-    collector_irradiance[collector_irradiance < 0] = 0
-    collector_irradiance = collector_irradiance.fillna(0)
+    collector_irradiance = _collector_irradiance(
+        np.asarray(irradiance_on_collector, dtype=float), cleanliness
+    )
+    return like_input(
+        collector_irradiance, irradiance_on_collector, cleanliness
+    )
+
 
-    return collector_irradiance
+#: Number of incidence angle modifier parameters used per loss method
+IAM_PRESETS = {"Janotte": 2, "Andasol": 6}
 
 
 def calc_iam(a_1, a_2, a_3, a_4, a_5, a_6, aoi, loss_method):
@@ -348,6 +434,8 @@ def calc_iam(a_1, a_2, a_3, a_4, a_5, a_6, aoi, loss_method):
     - a_4 \cdot \vert\varTheta\vert^4 - a_5 \cdot \vert\varTheta\vert^5
     - a_6 \cdot \vert\varTheta\vert^6`
 
+    Both methods are presets of :func:`calc_iam_polynomial`.
+
     Parameters
     ----------
     a_1, a_2, a_3, a_4, a_5, a_6: numeric
@@ -366,20 +454,47 @@ def calc_iam(a_1, a_2, a_3, a_4, a_5, a_6, aoi, loss_method):
     Incidence angle modifier: series of numeric
 
     """
-    if loss_method == "Janotte":
-        iam = 1 - a_1 * abs(aoi) - a_2 * aoi**2
-
-    if loss_method == "Andasol":
-        iam = (
-            1
-            - a_1 * abs(aoi)
-            - a_2 * aoi**2
-            - a_3 * aoi**3
-            - a_4 * aoi**4
-            - a_5 * aoi**5
-            - a_6 * aoi**6
-        )
-    return iam
+    if loss_method not in IAM_PRESETS:
+        raise ValueError("loss_method should be 'Janotte' or 'Andasol'")
+
+    coefficients = (a_1, a_2, a_3, a_4, a_5, a_6)[: IAM_PRESETS[loss_method]]
+    return calc_iam_polynomial(coefficients, aoi)
+
+
+def calc_iam_polynomial(coefficients, aoi):
+    r"""
+    Calculates the incidence angle modifier for a polynomial of arbitrary
+    order.
+
+    .. calc_iam_polynomial_equation:
+
+    :math:`\kappa(\varTheta) = 1 - \sum_{k=1}^{n} a_k \cdot
+    \vert\varTheta\vert^k`
+
+    The polynomial is evaluated with the Horner scheme in place on a single
+    array, so the number of temporary arrays does not grow with the order.
+
+    Parameters
+    ----------
+    coefficients: sequence of numeric
+        Parameters :math:`a_1, ..., a_n` of the incident angle modifier.
+
+    aoi: numeric or series of numeric
+        Angle of incidence.
+
+    Returns
+    -------
+    Incidence angle modifier: numeric, list, numpy.ndarray or pandas.Series
+        In the container type of `aoi`.
+
+    """
+    aoi_abs = np.abs(np.asarray(aoi, dtype=float))
+    iam = np.zeros_like(aoi_abs)
+    for coefficient in reversed(coefficients):
+        iam -= coefficient
+        iam *= aoi_abs
+    iam += 1
+    return like_input(iam, aoi)
 
 
 def calc_eta_c(
@@ -443,23 +558,145 @@ def calc_eta_c(
 
     """
 
-    if loss_method == "Janotte":
-        delta_temp = (
-            temp_collector_inlet + temp_collector_outlet
-        ) / 2 - temp_amb
-        eta_c = (
-            eta_0 * iam
-            - c_1 * delta_temp / collector_irradiance
-            - c_2 * delta_temp**2 / collector_irradiance
-        )
+    eta_c = _eta_c(
+        eta_0,
+        c_1,
+        c_2,
+        np.asarray(iam, dtype=float),
+        _delta_temp(temp_collector_inlet, temp_collector_outlet, temp_amb),
+        np.asarray(collector_irradiance, dtype=float),
+        loss_method,
+    )
+    return like_input(
+        eta_c,
+        collector_irradiance,
+        iam,
+        temp_collector_inlet,
+        temp_collector_outlet,
+        temp_amb,
+    )
+
+
+def calc_collector_output(
+    irradiance_on_collector,
+    cleanliness,
+    eta_0,
+    c_1,
+    c_2,
+    iam,
+    temp_collector_inlet,
+    temp_collector_outlet,
+    temp_amb,
+    loss_method,
+    out=None,
+):
+    r"""
+    Calculates the irradiance on the collector after all losses, the
+    collectors efficiency and the collectors heat in one pass.
+
+    This combines :func:`calc_collector_irradiance`, :func:`calc_eta_c` and
+    :func:`calc_heat_coll` on numpy arrays without intermediate Series.
+    Arguments are broadcast against each other and are used by position.
+
+    Parameters
+    ----------
+    irradiance_on_collector: array-like of numeric
+        Irradiance which hits collectors surface.
+
+    cleanliness: numeric
+        Cleanliness of the collector (between 0 and 1).
+
+    out: tuple of three numpy.ndarray (optional)
+        Buffers for collector irradiance, efficiency and heat. If given, the
+        results are written into them.
 
-    if loss_method == "Andasol":
-        eta_c = eta_0 * iam - c_1 / collector_irradiance
+    See :func:`calc_eta_c` for the other parameters.
 
-    eta_c[eta_c < 0] = 0
-    eta_c[eta_c == np.inf] = 0
-    eta_c = eta_c.fillna(0)
-    return eta_c
+    Returns
+    -------
+    collector_irradiance, eta_c, collector_heat: numpy.ndarray
+        Irradiance on collector after all losses, collectors efficiency and
+        collectors heat.
+    """
+    if out is None:
+        out = (None, None, None)
+    collector_irradiance = _collector_irradiance(
+        np.asarray(irradiance_on_collector, dtype=float),
+        cleanliness,
+        out=out[0],
+    )
+    eta_c = _eta_c(
+        eta_0,
+        c_1,
+        c_2,
+        np.asarray(iam, dtype=float),
+        _delta_temp(temp_collector_inlet, temp_collector_outlet, temp_amb),
+        collector_irradiance,
+        loss_method,
+        out=out[1],
+    )
+    collector_heat = np.multiply(collector_irradiance, eta_c, out=out[2])
+    return collector_irradiance, eta_c, collector_heat
+
+
+def _collector_irradiance(irradiance_on_collector, cleanliness, out=None):
+    r"""
+    Reduces the irradiance by the cleanliness. Negative and NaN values are
+    set to 0.
+    """
+    out = np.multiply(irradiance_on_collector, cleanliness**1.5, out=out)
+    # fmax ignores NaN, so NaN and negative values both become 0
+    return np.fmax(out, 0, out=out)
+
+
+def _delta_temp(temp_collector_inlet, temp_collector_outlet, temp_amb):
+    r"""
+    Returns the difference between mean collector and ambient temperature.
+    """
+    return (
+        np.asarray(temp_collector_inlet, dtype=float)
+        + np.asarray(temp_collector_outlet, dtype=float)
+    ) / 2 - np.asarray(temp_amb, dtype=float)
+
+
+def _eta_c(
+    eta_0,
+    c_1,
+    c_2,
+    iam,
+    delta_temp,
+    collector_irradiance,
+    loss_method,
+    out=None,
+):
+    r"""
+    Evaluates the collectors efficiency on numpy arrays. Negative, infinite
+    and NaN values are set to 0.
+    """
+    if loss_method not in ["Janotte", "Andasol"]:
+        raise ValueError("loss_method should be 'Janotte' or 'Andasol'")
+
+    shape = np.broadcast_shapes(
+        np.shape(iam), np.shape(delta_temp), np.shape(collector_irradiance)
+    )
+    if out is None:
+        out = np.empty(shape)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.multiply(eta_0, iam, out=out)
+        if loss_method == "Janotte":
+            losses = np.empty(shape)
+            np.multiply(c_1, delta_temp, out=losses)
+            np.divide(losses, collector_irradiance, out=losses)
+            out -= losses
+            np.multiply(c_2, delta_temp**2, out=losses)
+            np.divide(losses, collector_irradiance, out=losses)
+            out -= losses
+        else:  # loss_method == "Andasol"
+            out -= np.divide(c_1, collector_irradiance)
+
+    out[out == np.inf] = 0
+    return np.fmax(out, 0, out=out)
 
 
 def calc_heat_coll(eta_c, collector_irradiance):
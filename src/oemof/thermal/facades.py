@@ -26,9 +26,12 @@ attributes.
 
 SPDX-License-Identifier: MIT
 """
+import inspect
+import numbers
 import warnings
-from collections import deque
 
+import numpy as np
+import pandas as pd
 from oemof.network.energy_system import EnergySystem
 from oemof.network.network import Node
 from oemof.solph import Flow
@@ -39,8 +42,15 @@ from oemof.solph.components import GenericStorage
 from oemof.solph.components import Source
 from oemof.tools.debugging import SuspiciousUsageWarning
 
+from oemof.thermal._helpers import LRUCache
+from oemof.thermal._helpers import fingerprint
 from oemof.thermal.concentrating_solar_power import csp_precalc
+from oemof.thermal.fluid_properties import calc_fluid_properties
+from oemof.thermal.solar_position import solar_position_cache
 from oemof.thermal.solar_thermal_collector import flat_plate_precalc
+from oemof.thermal.solar_thermal_collector import (
+    flat_plate_precalc_orientations,
+)
 from oemof.thermal.stratified_thermal_storage import calculate_capacities
 from oemof.thermal.stratified_thermal_storage import calculate_losses
 from oemof.thermal.stratified_thermal_storage import (
@@ -49,7 +59,45 @@ from oemof.thermal.stratified_thermal_storage import (
 
 
 def add_subnodes(n, **kwargs):
-    deque((kwargs["EnergySystem"].add(sn) for sn in n.subnodes), maxlen=0)
+    kwargs["EnergySystem"].add(*n.subnodes)
+
+
+def add_facades(energysystem, facades):
+    r"""
+    Adds many facades and their subnodes to an energy system at once.
+
+    The facades are added in one call of
+    :meth:`~oemof.network.energy_system.EnergySystem.add`. Their subnodes
+    are added by the single receiver of the add signal, which is connected
+    once for all facades.
+
+    Parameters
+    ----------
+    energysystem : oemof.solph.EnergySystem
+        The energy system.
+    facades : iterable of Facade
+        The facades to add.
+
+    Returns
+    -------
+    facades : list of Facade
+        The added facades.
+    """
+    facades = list(facades)
+    energysystem.add(*facades)
+    return facades
+
+
+_precalc_cache = LRUCache(maxsize=32)
+
+
+def _add_facade_subnodes(n, **kwargs):
+    # Receives every node added to any energy system, so one subscription
+    # serves all facades instead of one subscription per facade
+    if isinstance(n, Facade):
+        if getattr(n, "lazy", False) and not n.subnodes:
+            n.build_solph_components()
+        add_subnodes(n, **kwargs)
 
 
 class Facade(Node):
@@ -60,9 +108,13 @@ class Facade(Node):
         A list of required attributes. The constructor checks whether these are
         present as keyword arguments or whether they are already present on
         self (which means they have been set by constructors of subclasses) and
-        raises an error if he doesn't find them.
+        raises an error if he doesn't find them. Defaults to the class
+        attribute of the same name, which subclasses set to the attributes
+        they require.
     """
 
+    _facade_requires_ = []
+
     def __init__(self, label, **kwargs):
         """ """
 
@@ -70,14 +122,11 @@ class Facade(Node):
 
         self.type = kwargs.get("type")
 
-        required = kwargs.pop("_facade_requires_", [])
+        required = kwargs.pop("_facade_requires_", self._facade_requires_)
 
         super().__init__(label=label)
 
         self.subnodes = []
-        EnergySystem.signals[EnergySystem.add].connect(
-            add_subnodes, sender=self
-        )
 
         for r in required:
             if r in kwargs:
@@ -142,6 +191,9 @@ class Facade(Node):
         self.build_solph_components()
 
 
+EnergySystem.signals[EnergySystem.add].connect(_add_facade_subnodes)
+
+
 class StratifiedThermalStorage(GenericStorage, Facade):
     r"""Stratified thermal storage unit.
 
@@ -153,16 +205,22 @@ class StratifiedThermalStorage(GenericStorage, Facade):
         Diameter of the storage [m]
     height : numeric
         Height of the storage [m]
-    temp_h : numeric
+    temp_h : numeric or sequence
         Temperature of the hot (upper) part of the water body.
-    temp_c : numeric
+    temp_c : numeric or sequence
         Temperature of the cold (upper) part of the water body.
-    temp_env : numeric
-        Temperature of the environment.
+    temp_env : numeric or sequence
+        Temperature of the environment, e.g. the ambient temperature of an
+        outdoor tank.
     heat_capacity : numeric
         Assumed constant for heat capacity of the water.
     density : numeric
         Assumed constant for density of the water.
+    medium : str (optional)
+        Storage medium, e.g. 'water'. If given, heat capacity and density
+        are taken from the property table of
+        :func:`~oemof.thermal.fluid_properties.calc_fluid_properties` at the
+        mean of :attr:`temp_h` and :attr:`temp_c` per timestep.
     u_value : numeric
         Thermal transmittance [W/(m2*K)]
     capacity: numeric
@@ -187,11 +245,16 @@ class StratifiedThermalStorage(GenericStorage, Facade):
     output_parameters: dict (optional)
         Set parameters on the output edge of the storage (see oemof.solph for
         more information on possible parameters)
-
-
-    The attribute :attr:`nominal_storage_capacity` of the base class
-    :class:`GenericStorage` should not be passed because it is determined
-    internally from :attr:`height` and :attr:`parameter`.
+    loss_rate, fixed_losses_relative, fixed_losses_absolute : numeric
+        Losses of the storage, single values or sequences (optional). If
+        not given, they are calculated with
+        :func:`~oemof.thermal.stratified_thermal_storage.calculate_losses`.
+    nominal_storage_capacity : numeric (optional)
+        Nominal storage capacity [MWh]. If not given, it is determined
+        from :attr:`height`, :attr:`diameter` and the temperatures. If the
+        temperatures vary over time, it refers to the maximum difference of
+        :attr:`temp_h` and :attr:`temp_c`. A capacity set on the facade
+        later is used on :meth:`update`.
 
     Examples
     ---------
@@ -213,6 +276,15 @@ class StratifiedThermalStorage(GenericStorage, Facade):
     ...     capacity=1)
     """
 
+    _facade_requires_ = [
+        "bus",
+        "diameter",
+        "temp_h",
+        "temp_c",
+        "temp_env",
+        "u_value",
+    ]
+
     def __init__(
         self,
         label=None,
@@ -227,31 +299,68 @@ class StratifiedThermalStorage(GenericStorage, Facade):
         min_storage_level=0.0,
         max_storage_level=1.0,
         balanced=True,
-        loss_rate=0,
-        fixed_losses_relative=0,
-        fixed_losses_absolute=0,
+        loss_rate=None,
+        fixed_losses_relative=None,
+        fixed_losses_absolute=None,
         inflow_conversion_factor=1,
         outflow_conversion_factor=1,
         custom_attributes=None,
         **kwargs,
     ):
-        kwargs.update(
-            {
-                "_facade_requires_": [
-                    "bus",
-                    "diameter",
-                    "temp_h",
-                    "temp_c",
-                    "temp_env",
-                    "u_value",
-                ]
-            }
-        )
         Facade.__init__(
             self,
             label=label,
             **kwargs,
         )
+
+        self.medium = kwargs.get("medium")
+
+        if self.medium is not None:
+            # Properties of the medium per timestep at the mean temperature
+            heat_capacity, density = calc_fluid_properties(
+                0.5 * (np.asarray(self.temp_h) + np.asarray(self.temp_c)),
+                self.medium,
+            )
+            self.water_properties = {
+                "heat_capacity": heat_capacity,
+                "density": density,
+            }
+        else:
+            self.water_properties = {
+                "heat_capacity": kwargs.get("heat_capacity"),
+                "density": kwargs.get("density"),
+            }
+
+        # The nominal storage capacity refers to the maximum temperature
+        # difference if the temperatures vary over time
+        self.temp_difference = np.max(np.subtract(self.temp_h, self.temp_c))
+
+        # The losses are passed to GenericStorage, which converts them to
+        # sequences only once. Losses which are given are used as they are.
+        losses = [loss_rate, fixed_losses_relative, fixed_losses_absolute]
+        if any(loss is None for loss in losses):
+            calculated_losses = calculate_losses(
+                self.u_value,
+                self.diameter,
+                self.temp_h,
+                self.temp_c,
+                self.temp_env,
+                nominal_temp_difference=self.temp_difference,
+                **{
+                    key: value
+                    for key, value in self.water_properties.items()
+                    if value is not None
+                },
+            )
+            losses = [
+                calculated if loss is None else loss
+                for loss, calculated in zip(losses, calculated_losses)
+            ]
+
+        # Set by build_solph_components to tell a calculated nominal storage
+        # capacity from a given one
+        self._calculated_nominal_storage_capacity = None
+
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore", category=SuspiciousUsageWarning)
 
@@ -269,9 +378,9 @@ class StratifiedThermalStorage(GenericStorage, Facade):
                 min_storage_level=min_storage_level,
                 max_storage_level=max_storage_level,
                 balanced=balanced,
-                loss_rate=loss_rate,
-                fixed_losses_relative=fixed_losses_relative,
-                fixed_losses_absolute=fixed_losses_absolute,
+                loss_rate=losses[0],
+                fixed_losses_relative=losses[1],
+                fixed_losses_absolute=losses[2],
                 inflow_conversion_factor=inflow_conversion_factor,
                 outflow_conversion_factor=outflow_conversion_factor,
                 custom_attributes=custom_attributes,
@@ -279,11 +388,6 @@ class StratifiedThermalStorage(GenericStorage, Facade):
 
         self.height = kwargs.get("height")
 
-        self.water_properties = {
-            "heat_capacity": kwargs.get("heat_capacity"),
-            "density": kwargs.get("density"),
-        }
-
         self.capacity = kwargs.get("capacity")
 
         self.storage_capacity_cost = kwargs.get("storage_capacity_cost")
@@ -315,25 +419,6 @@ class StratifiedThermalStorage(GenericStorage, Facade):
 
         self.output_parameters = kwargs.get("output_parameters", {})
 
-        losses = calculate_losses(
-            self.u_value,
-            self.diameter,
-            self.temp_h,
-            self.temp_c,
-            self.temp_env,
-            **{
-                key: value
-                for key, value in self.water_properties.items()
-                if value is not None
-            },
-        )
-
-        self.loss_rate = losses[0]
-
-        self.fixed_losses_relative = losses[1]
-
-        self.fixed_losses_absolute = losses[2]
-
         self.build_solph_components()
 
     def build_solph_components(self):
@@ -342,12 +427,6 @@ class StratifiedThermalStorage(GenericStorage, Facade):
 
         self.outflow_conversion_factor = sequence(self.efficiency)
 
-        self.loss_rate = sequence(self.loss_rate)
-
-        self.fixed_losses_relative = sequence(self.fixed_losses_relative)
-
-        self.fixed_losses_absolute = sequence(self.fixed_losses_absolute)
-
         # make it investment but don't set costs (set below for flow (power))
         self.investment = self._investment()
 
@@ -380,20 +459,30 @@ class StratifiedThermalStorage(GenericStorage, Facade):
             # required for correct grouping in oemof.solph.components
             self._invest_group = True
         else:
-            self.volume = calculate_storage_dimensions(
-                self.height, self.diameter
-            )[0]
-
-            self.nominal_storage_capacity = calculate_capacities(
-                self.volume,
-                self.temp_h,
-                self.temp_c,
-                **{
-                    key: value
-                    for key, value in self.water_properties.items()
-                    if value is not None
-                },
-            )
+            # A nominal storage capacity which is given or set on the facade
+            # is read again on every update, a calculated one is recalculated
+            if self.nominal_storage_capacity is None or (
+                self.nominal_storage_capacity
+                is self._calculated_nominal_storage_capacity
+            ):
+                self.volume = calculate_storage_dimensions(
+                    self.height, self.diameter
+                )[0]
+                self.nominal_storage_capacity = np.max(
+                    calculate_capacities(
+                        self.volume,
+                        self.temp_h,
+                        self.temp_c,
+                        **{
+                            key: value
+                            for key, value in self.water_properties.items()
+                            if value is not None
+                        },
+                    )
+                )
+                self._calculated_nominal_storage_capacity = (
+                    self.nominal_storage_capacity
+                )
 
             fi = Flow(
                 nominal_value=self._nominal_value(), **self.input_parameters
@@ -411,7 +500,69 @@ class StratifiedThermalStorage(GenericStorage, Facade):
         self._set_flows()
 
 
-class ParabolicTroughCollector(Converter, Facade):
+class _LazyPrecalc:
+    r"""
+    Mixin for facades whose time series are precalculated, e.g. with
+    :func:`~oemof.thermal.solar_thermal_collector.flat_plate_precalc`.
+
+    The precalculation runs on the first access of :attr:`precalc_data`.
+    Without `lazy` this happens when the facade is created. With
+    `lazy=True` the solph components are built when the facade is added to
+    an energy system, so facades that are never added are never
+    precalculated.
+
+    With `memoize=True`, facades with identical precalculation arguments
+    share one result (by reference) from a module level cache, which keeps
+    the 32 most recently used results, see :func:`clear_precalc_cache`. A
+    dict can be passed instead to use it as cache.
+
+    Subclasses implement :meth:`_precalc_call`, returning the
+    precalculation function and its positional and keyword arguments.
+    """
+
+    def _init_precalc(self, lazy=False, memoize=False, **kwargs):
+        self.lazy = bool(lazy)
+        if memoize is True:
+            memoize = _precalc_cache
+        elif memoize is False:
+            memoize = None
+        self.memoize = memoize
+        self._precalc_data = None
+        if not self.lazy:
+            self.build_solph_components()
+
+    @property
+    def precalc_data(self):
+        """Result of the precalculation (computed on first access)."""
+        if self._precalc_data is None:
+            function, args, kwargs = self._precalc_call()
+            if self.memoize is None:
+                self._precalc_data = function(*args, **kwargs)
+            else:
+                key = (
+                    function.__module__,
+                    function.__name__,
+                    tuple(fingerprint(arg) for arg in args),
+                    tuple(
+                        (name, fingerprint(arg))
+                        for name, arg in sorted(kwargs.items())
+                    ),
+                )
+                if key not in self.memoize:
+                    self.memoize[key] = function(*args, **kwargs)
+                self._precalc_data = self.memoize[key]
+        return self._precalc_data
+
+    def _precalc_call(self):
+        raise NotImplementedError
+
+
+def clear_precalc_cache():
+    r"""Clears the module level cache of memoized precalculations."""
+    _precalc_cache.clear()
+
+
+class ParabolicTroughCollector(_LazyPrecalc, Converter, Facade):
     r"""Parabolic trough collector unit
 
     Parameters
@@ -429,6 +580,14 @@ class ParabolicTroughCollector(Converter, Facade):
         pipes and pumps.
     aperture_area: numeric
         Specify the ares or size of the collector.
+    lazy: boolean
+        If True, the precalculation is deferred until the collector is added
+        to an energy system or :attr:`collectors_heat` is accessed.
+        Default: False.
+    memoize: boolean or dict
+        If True, collectors with identical precalculation arguments share
+        one precalculated series. A dict is used as cache instead of the
+        module level one. Default: False.
 
 
     See the API of csp_precalc in oemof.thermal.concentrating_solar_power for
@@ -466,9 +625,10 @@ class ParabolicTroughCollector(Converter, Facade):
     ... )
     """
 
+    _facade_requires_ = ["longitude"]
+
     def __init__(self, **kwargs):
 
-        kwargs.update({"_facade_requires_": ["longitude"]})
         Facade.__init__(self, **kwargs)
         Converter.__init__(self, label=kwargs.get("label"))
 
@@ -524,31 +684,16 @@ class ParabolicTroughCollector(Converter, Facade):
 
         self.expandable = bool(kwargs.get("expandable", False))
 
-        if self.irradiance_method == "horizontal":
-            heat = csp_precalc(
-                self.latitude,
-                self.longitude,
-                self.collector_tilt,
-                self.collector_azimuth,
-                self.cleanliness,
-                self.eta_0,
-                self.c_1,
-                self.c_2,
-                self.temp_collector_inlet,
-                self.temp_collector_outlet,
-                self.temp_amb,
-                self.a_1,
-                self.a_2,
-                self.a_3,
-                self.a_4,
-                self.a_5,
-                self.a_6,
-                loss_method=self.loss_method,
-                irradiance_method=self.irradiance_method,
-                E_dir_hor=self.irradiance,
-            )
-        if self.irradiance_method == "normal":
-            heat = csp_precalc(
+        self._init_precalc(**kwargs)
+
+    def _precalc_call(self):
+        irradiance = {
+            "horizontal": {"E_dir_hor": self.irradiance},
+            "normal": {"dni": self.irradiance},
+        }.get(self.irradiance_method, {})
+        return (
+            csp_precalc,
+            (
                 self.latitude,
                 self.longitude,
                 self.collector_tilt,
@@ -566,14 +711,19 @@ class ParabolicTroughCollector(Converter, Facade):
                 self.a_4,
                 self.a_5,
                 self.a_6,
-                loss_method=self.loss_method,
-                irradiance_method=self.irradiance_method,
-                dni=self.irradiance,
-            )
-
-        self.collectors_heat = heat["collector_heat"]
+            ),
+            {
+                "loss_method": self.loss_method,
+                "irradiance_method": self.irradiance_method,
+                **irradiance,
+            },
+        )
 
-        self.build_solph_components()
+    @property
+    def collectors_heat(self):
+        """Heat of the collector per aperture area (computed on first
+        access)."""
+        return self.precalc_data["collector_heat"]
 
     def build_solph_components(self):
         """ """
@@ -608,7 +758,7 @@ class ParabolicTroughCollector(Converter, Facade):
         self.subnodes = (inflow,)
 
 
-class SolarThermalCollector(Converter, Facade):
+class SolarThermalCollector(_LazyPrecalc, Converter, Facade):
     r"""Solar thermal collector unit
 
     Parameters:
@@ -626,6 +776,14 @@ class SolarThermalCollector(Converter, Facade):
         pipes and pumps as percentage of provided thermal energy.
     aperture_area: numeric
         Specifies the size of the collector as surface area.
+    lazy: boolean
+        If True, the precalculation is deferred until the collector is added
+        to an energy system or :attr:`collectors_heat` is accessed.
+        Default: False.
+    memoize: boolean or dict
+        If True, collectors with identical precalculation arguments share
+        one precalculated series. A dict is used as cache instead of the
+        module level one. Default: False.
 
     See the API of flat_plate_precalc in oemof.thermal.solar_thermal_collector
     for the other parameters.
@@ -658,9 +816,10 @@ class SolarThermalCollector(Converter, Facade):
     )
     """
 
+    _facade_requires_ = ["longitude"]
+
     def __init__(self, **kwargs):
 
-        kwargs.update({"_facade_requires_": ["longitude"]})
         Facade.__init__(self, **kwargs)
         Converter.__init__(self, label=kwargs.get("label"))
 
@@ -700,26 +859,38 @@ class SolarThermalCollector(Converter, Facade):
 
         self.expandable = bool(kwargs.get("expandable", False))
 
-        data = flat_plate_precalc(
-            self.latitude,
-            self.longitude,
-            self.collector_tilt,
-            self.collector_azimuth,
-            self.eta_0,
-            self.a_1,
-            self.a_2,
-            self.temp_collector_inlet,
-            self.delta_temp_n,
-            self.irradiance_global,
-            self.irradiance_diffuse,
-            self.temp_amb,
-        )
+        self._init_precalc(**kwargs)
 
-        self.collectors_eta_c = data["eta_c"]
+    def _precalc_call(self):
+        return (
+            flat_plate_precalc,
+            (
+                self.latitude,
+                self.longitude,
+                self.collector_tilt,
+                self.collector_azimuth,
+                self.eta_0,
+                self.a_1,
+                self.a_2,
+                self.temp_collector_inlet,
+                self.delta_temp_n,
+                self.irradiance_global,
+                self.irradiance_diffuse,
+                self.temp_amb,
+            ),
+            {},
+        )
 
-        self.collectors_heat = data["collectors_heat"]
+    @property
+    def collectors_eta_c(self):
+        """Efficiency of the collector (computed on first access)."""
+        return self.precalc_data["eta_c"]
 
-        self.build_solph_components()
+    @property
+    def collectors_heat(self):
+        """Heat of the collector per aperture area (computed on first
+        access)."""
+        return self.precalc_data["collectors_heat"]
 
     def build_solph_components(self):
         """ """
@@ -753,3 +924,278 @@ class SolarThermalCollector(Converter, Facade):
         self.outputs.update({self.heat_out_bus: Flow()})
 
         self.subnodes = (inflow,)
+
+
+_bus_columns = [
+    "bus",
+    "heat_out_bus",
+    "electricity_in_bus",
+    "heat_bus",
+    "electrical_bus",
+]
+
+
+def facades_from_frame(facade_type, table, buses=None, weather=None, **kwargs):
+    r"""
+    Creates one facade per row of a table.
+
+    The columns are validated once for the whole table. For
+    :class:`StratifiedThermalStorage` the losses and the nominal storage
+    capacities of all rows are calculated in one vectorised call. The
+    collectors are precalculated grouped by site: the solar position is
+    calculated once per site, flat plate collectors differing only in their
+    orientation share one call of
+    :func:`~oemof.thermal.solar_thermal_collector.flat_plate_precalc_orientations`
+    and collectors with identical arguments share one result. Rows with
+    `lazy=True` are left to the facade.
+
+    Parameters
+    ----------
+    facade_type : type
+        :class:`StratifiedThermalStorage`, :class:`SolarThermalCollector`,
+        :class:`ParabolicTroughCollector` or a subclass of them. The
+        attributes it requires (`_facade_requires_`) are validated for the
+        whole table.
+
+    table : pandas.DataFrame
+        One row per facade, the columns are the keyword arguments of the
+        facade. Missing values (NaN) are left out, so that the defaults of
+        the facade apply. Missing values of required columns raise a
+        KeyError naming the row and the column.
+
+    buses : dict (optional)
+        Buses by label. Bus columns holding labels are resolved with it.
+
+    weather : dict (optional)
+        Keyword arguments per site, e.g. the weather time series
+        (`irradiance_global`, `temp_amb`, ...). They are added to the rows
+        by the column 'site'.
+
+    **kwargs
+        Keyword arguments passed to all facades, e.g. a common bus.
+
+    Returns
+    -------
+    facades : list of Facade
+        The facades in the order of the rows.
+    """
+    name = facade_type.__name__
+    if not issubclass(facade_type, (StratifiedThermalStorage, _LazyPrecalc)):
+        raise ValueError(
+            f"Facade type '{name}' is not supported. Please choose "
+            "StratifiedThermalStorage, SolarThermalCollector, "
+            "ParabolicTroughCollector or a subclass of them."
+        )
+    required = facade_type._facade_requires_
+
+    records = table.to_dict("records")
+    if weather is not None:
+        if "site" not in table.columns:
+            raise KeyError("Column 'site' is required to assign the weather.")
+        unknown = set(table["site"]) - set(weather)
+        if unknown:
+            raise KeyError(
+                f"No weather given for the sites {sorted(unknown)}."
+            )
+        records = [{**weather[row["site"]], **row} for row in records]
+        site_columns = {key for values in weather.values() for key in values}
+    else:
+        site_columns = set()
+
+    columns = set(table.columns) | set(kwargs) | site_columns
+    missing = set(required) - columns
+    if missing:
+        raise KeyError(
+            f"Columns {sorted(missing)} are missing to create "
+            f"{name} facades."
+        )
+
+    records = [
+        {
+            **kwargs,
+            **{
+                key: value
+                for key, value in row.items()
+                if key != "site" and not _is_missing(value)
+            },
+        }
+        for row in records
+    ]
+    blank = [
+        f"{column!r} of row {index!r}"
+        for index, row in zip(table.index, records)
+        for column in required
+        if column not in row
+    ]
+    if blank:
+        raise KeyError(
+            f"Values are missing to create {name} facades: "
+            f"{', '.join(blank)}."
+        )
+    if buses is not None:
+        for row in records:
+            for column in _bus_columns:
+                if isinstance(row.get(column), str):
+                    row[column] = buses[row[column]]
+
+    if issubclass(facade_type, StratifiedThermalStorage):
+        calculated = _precalculate_storages(records)
+        storages = [facade_type(**row) for row in records]
+        for storage, is_calculated in zip(storages, calculated):
+            if is_calculated:
+                # Recalculated on update() like the capacity of a storage
+                # which is created directly
+                storage._calculated_nominal_storage_capacity = (
+                    storage.nominal_storage_capacity
+                )
+        return storages
+
+    # The facades are created lazily and precalculated together below,
+    # unless they are meant to be lazy
+    lazy = [bool(row.get("lazy", False)) for row in records]
+    memoize = kwargs.get("memoize", {})
+    for row in records:
+        row.setdefault("memoize", memoize)
+        row["lazy"] = True
+    collectors = [facade_type(**row) for row in records]
+
+    eager = [c for c, is_lazy in zip(collectors, lazy) if not is_lazy]
+    _precalculate_collectors(eager)
+    for collector in eager:
+        collector.lazy = False
+        collector.build_solph_components()
+    return collectors
+
+
+def _is_missing(value):
+    r"""Returns True for missing values (None or NaN) of a table."""
+    return value is None or (isinstance(value, float) and np.isnan(value))
+
+
+def _precalculate_storages(records):
+    r"""
+    Adds the losses and nominal storage capacities of all rows of a table
+    of storages to the keyword arguments of the facades in one vectorised
+    calculation. Values given in the table are kept.
+
+    Rows with a medium or with time-varying temperatures are left to the
+    facade.
+
+    Returns a list telling for every row whether its nominal storage
+    capacity was calculated here.
+    """
+    calculated = [False] * len(records)
+    columns = {}
+    for column in ["diameter", "temp_h", "temp_c", "temp_env", "u_value"]:
+        values = [row[column] for row in records]
+        if not all(isinstance(value, numbers.Number) for value in values):
+            return calculated
+        columns[column] = np.array(values, dtype=float)
+    if any("medium" in row for row in records):
+        return calculated
+
+    # Rows without heat capacity or density use the defaults of the
+    # storage functions
+    defaults = inspect.signature(calculate_losses).parameters
+    properties = {
+        prop: np.array(
+            [row.get(prop, defaults[prop].default) for row in records],
+            dtype=float,
+        )
+        for prop in ["heat_capacity", "density"]
+    }
+    losses = calculate_losses(
+        columns["u_value"],
+        columns["diameter"],
+        columns["temp_h"],
+        columns["temp_c"],
+        columns["temp_env"],
+        **properties,
+    )
+    height = np.array([row.get("height", np.nan) for row in records])
+    volume = calculate_storage_dimensions(height, columns["diameter"])[0]
+    capacities = calculate_capacities(
+        volume, columns["temp_h"], columns["temp_c"], **properties
+    )
+
+    for i, row in enumerate(records):
+        for name, loss in zip(
+            ["loss_rate", "fixed_losses_relative", "fixed_losses_absolute"],
+            losses,
+        ):
+            row.setdefault(name, float(loss[i]))
+        if not (
+            np.isnan(capacities[i])
+            or row.get("expandable")
+            or "nominal_storage_capacity" in row
+        ):
+            row["nominal_storage_capacity"] = float(capacities[i])
+            calculated[i] = True
+    return calculated
+
+
+def _precalculate_collectors(collectors):
+    r"""
+    Runs the precalculations of collector facades grouped by their
+    arguments.
+
+    Flat plate collectors which differ only in their orientation, e.g. of
+    one site, are precalculated with one call of
+    `flat_plate_precalc_orientations`. Collectors with identical arguments
+    share one result. The solar positions are calculated once per location
+    and time index.
+
+    Arguments which are not plain values, e.g. the weather time series, are
+    compared by identity, so the rows of one site (which reference the same
+    weather) are grouped without hashing their data.
+    """
+    groups = {}
+    for collector in collectors:
+        function, args, kwargs = collector._precalc_call()
+        orientation = None
+        if function is flat_plate_precalc and all(
+            isinstance(value, numbers.Number) for value in args[2:4]
+        ):
+            orientation = tuple(args[2:4])
+            args = args[:2] + (None, None) + args[4:]
+        key = (function, _identity(args), _identity(sorted(kwargs.items())))
+        if key not in groups:
+            groups[key] = (function, args, kwargs, [])
+        groups[key][3].append((collector, orientation))
+
+    with solar_position_cache():
+        for function, args, kwargs, members in groups.values():
+            orientations = list(dict.fromkeys(o for _, o in members))
+            if orientations == [None]:
+                results = {None: function(*args, **kwargs)}
+            else:
+                tilt, azimuth = zip(*orientations)
+                data = flat_plate_precalc_orientations(
+                    *args[:2], tilt, azimuth, *args[4:]
+                )
+                results = {
+                    orientation: data.xs(
+                        orientation,
+                        axis=1,
+                        level=["collector_tilt", "collector_azimuth"],
+                    )
+                    for orientation in orientations
+                }
+            for collector, orientation in members:
+                collector._precalc_data = results[orientation]
+
+
+def _identity(values):
+    r"""
+    Returns a hashable key of `values`, which compares plain values by
+    value and other objects by identity.
+    """
+    key = []
+    for value in values:
+        if isinstance(value, tuple):
+            key.append(_identity(value))
+        elif value is None or isinstance(value, (numbers.Number, str)):
+            key.append(value)
+        else:
+            key.append(("id", id(value)))
+    return tuple(key)
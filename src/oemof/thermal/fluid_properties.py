@@ -0,0 +1,104 @@
+# -*- coding: utf-8
+
+"""
+This module provides temperature dependent properties of storage media
+from an embedded table, so that CoolProp is not needed at runtime.
+
+This file is part of project oemof (github.com/oemof/oemof-thermal). It's
+copyrighted by the contributors recorded in the version control history of the
+file, available from its original location:
+oemof-thermal/src/oemof/thermal/fluid_properties.py
+
+SPDX-License-Identifier: MIT
+"""
+
+import csv
+import os
+
+import numpy as np
+
+_filename = os.path.join(
+    os.path.dirname(__file__), "data", "fluid_properties.csv"
+)
+
+_tables = {}
+
+
+def available_media():
+    r"""
+    Returns the names of the media of the property table.
+
+    Returns
+    -------
+    media : list of str
+        E.g. 'water', 'MEG-30%' and 'MPG-30%'.
+    """
+    return sorted(_load_tables())
+
+
+def calc_fluid_properties(temperature, medium="water"):
+    r"""
+    Calculates specific heat capacity and density of a storage medium by
+    linear interpolation in an embedded property table.
+
+    The table was calculated with CoolProp with a resolution of 1 K. Water
+    is tabulated as saturated liquid from 1 to 150 °C, the mixtures of water
+    with 30 % ethylene glycol ('MEG-30%') or propylene glycol ('MPG-30%')
+    from -10 to 100 °C. The table is read only once.
+
+    Parameters
+    ----------
+    temperature : numeric or array-like
+        Temperature of the medium [deg C]
+
+    medium : str
+        Name of the medium, see :func:`available_media`. Default: 'water'.
+
+    Returns
+    -------
+    heat_capacity : numeric or numpy.ndarray
+        Specific heat capacity [J/(kg*K)]
+
+    density : numeric or numpy.ndarray
+        Density [kg/m3]
+    """
+    tables = _load_tables()
+    if medium not in tables:
+        raise ValueError(
+            f"Medium '{medium}' is not available. "
+            f"Please choose from {sorted(tables)}."
+        )
+    table = tables[medium]
+
+    temperature = np.asarray(temperature, dtype=float)
+    grid = table["temperature"]
+    if np.any(temperature < grid[0]) or np.any(temperature > grid[-1]):
+        raise ValueError(
+            f"Temperatures outside of the range of the property table of "
+            f"'{medium}' [{grid[0]}, {grid[-1]}]!"
+        )
+
+    heat_capacity = np.interp(temperature, grid, table["heat_capacity"])
+    density = np.interp(temperature, grid, table["density"])
+    if temperature.ndim == 0:
+        return float(heat_capacity), float(density)
+    return heat_capacity, density
+
+
+def _load_tables():
+    r"""
+    Returns the property tables per medium, reading the file on first use.
+    """
+    if not _tables:
+        rows = {}
+        with open(_filename, encoding="utf-8") as file:
+            lines = (line for line in file if not line.startswith("#"))
+            for row in csv.DictReader(lines):
+                rows.setdefault(row.pop("medium"), []).append(row)
+        for medium, medium_rows in rows.items():
+            medium_rows.sort(key=lambda row: float(row["temperature"]))
+            _tables[medium] = {
+                name: np.array([row[name] for row in medium_rows], dtype=float)
+                for name in ["temperature", "heat_capacity", "density"]
+            }
+    return _tables
@@ -0,0 +1,128 @@
+# -*- coding: utf-8
+
+"""
+This module provides a driver to run the precalculations of the collectors
+for many sites in parallel.
+
+This file is part of project oemof (github.com/oemof/oemof-thermal). It's
+copyrighted by the contributors recorded in the version control history of the
+file, available from its original location:
+oemof-thermal/src/oemof/thermal/parallel.py
+
+SPDX-License-Identifier: MIT
+"""
+
+import os
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pandas as pd
+
+
+def precalc_sites(
+    precalc, sites, max_workers=None, chunksize=1, stats=None, **kwargs
+):
+    r"""
+    Runs a precalculation for many sites, fanned out over a process pool.
+
+    The results are yielded in the order of `sites` as soon as they are
+    available. With `max_workers=1` the sites are processed serially in the
+    calling process; the parallel results are identical to the serial ones.
+
+    On platforms which start worker processes with 'spawn' (Windows, macOS)
+    the calling script has to be protected by
+    ``if __name__ == "__main__":``.
+
+    Parameters
+    ----------
+    precalc: callable
+        Module level precalculation function, e.g.
+        :func:`oemof.thermal.solar_thermal_collector.flat_plate_precalc` or
+        :func:`oemof.thermal.concentrating_solar_power.csp_precalc`.
+
+    sites: pandas.DataFrame or iterable of dict
+        One row (or dict) per site holding the keyword arguments of
+        `precalc`, e.g. 'lat', 'long' and the weather Series.
+
+    max_workers: int or None
+        Number of worker processes. None uses the number of processors.
+
+    chunksize: int
+        Number of sites sent to a worker at once. Larger chunks reduce the
+        scheduling overhead for many small sites. Default: 1.
+
+    stats: dict (optional)
+        If given, it is filled with measured overheads:
+
+        * 'startup': time to start the pool and its workers [s]
+        * 'pickling': time to pickle the site arguments [s]. The arguments
+          are pickled once before they are sent to the pool, so this is
+          the pickling the pool would otherwise do.
+        * 'pickled_bytes': size of the pickled site arguments [byte]
+        * 'total': total wall time without the pickling [s]
+        * 'sites': number of processed sites
+
+        Nothing is pickled with `max_workers=1`, so 'pickling' and
+        'pickled_bytes' are 0 then.
+
+    **kwargs
+        Keyword arguments passed to `precalc` for every site, e.g. the
+        collector parameters.
+
+    Yields
+    ------
+    data : pandas.DataFrame
+        Result of `precalc` per site.
+    """
+    if isinstance(sites, pd.DataFrame):
+        sites = sites.to_dict("records")
+    tasks = [(precalc, {**kwargs, **site}) for site in sites]
+
+    if stats is not None:
+        stats.update(
+            {
+                "startup": 0.0,
+                "pickling": 0.0,
+                "pickled_bytes": 0,
+                "sites": len(tasks),
+            }
+        )
+    start = time.perf_counter()
+
+    if max_workers == 1:
+        for task in tasks:
+            yield _run(task)
+    else:
+        run = _run
+        if stats is not None:
+            # The tasks are pickled up front to time the pickling; the pool
+            # then only copies the bytes, so nothing is pickled twice
+            tasks = [pickle.dumps(task) for task in tasks]
+            stats["pickling"] = time.perf_counter() - start
+            stats["pickled_bytes"] = sum(len(task) for task in tasks)
+            run = _run_pickled
+            start = time.perf_counter()
+        max_workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            if stats is not None:
+                # Workers are spawned lazily, so force them up front
+                list(executor.map(_noop, range(max_workers)))
+                stats["startup"] = time.perf_counter() - start
+            yield from executor.map(run, tasks, chunksize=chunksize)
+
+    if stats is not None:
+        stats["total"] = time.perf_counter() - start
+
+
+def _run(task):
+    precalc, kwargs = task
+    return precalc(**kwargs)
+
+
+def _run_pickled(task):
+    return _run(pickle.loads(task))
+
+
+def _noop(_):
+    return None
@@ -0,0 +1,180 @@
+# -*- coding: utf-8
+
+"""
+This module provides a cache for the solar position, which is shared by the
+precalculations of the solar thermal collector and the concentrating solar
+power collector.
+
+This file is part of project oemof (github.com/oemof/oemof-thermal). It's
+copyrighted by the contributors recorded in the version control history of the
+file, available from its original location:
+oemof-thermal/src/oemof/thermal/solar_position.py
+
+SPDX-License-Identifier: MIT
+"""
+
+from contextlib import contextmanager
+
+import pandas as pd
+import pvlib
+
+from oemof.thermal._helpers import LRUCache
+from oemof.thermal._helpers import fingerprint
+
+_cache = None
+
+
+class SolarPositionCache:
+    r"""
+    Least recently used (LRU) cache for solar positions.
+
+    Entries are keyed by a fingerprint of the time index, the latitude, the
+    longitude and the calculation method. If more than `maxsize` entries are
+    stored, the least recently used one is dropped, which bounds the memory
+    to `maxsize` solar position DataFrames.
+
+    The cached DataFrames are returned by reference and must not be
+    modified.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached solar positions. Default: 32.
+
+    Attributes
+    ----------
+    hits : int
+        Number of requests answered from the cache.
+    misses : int
+        Number of requests that required a calculation with pvlib.
+    """
+
+    def __init__(self, maxsize=32):
+        self._entries = LRUCache(maxsize)
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, time, latitude, longitude, method="nrel_numpy"):
+        r"""
+        Returns the solar position, calculating it only on a cache miss.
+
+        See :func:`get_solarposition` for the parameters.
+        """
+        key = (fingerprint(pd.Index(time)), latitude, longitude, method)
+        if key in self._entries:
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        solarposition = pvlib.solarposition.get_solarposition(
+            time=time, latitude=latitude, longitude=longitude, method=method
+        )
+        self._entries[key] = solarposition
+        return solarposition
+
+    def clear(self):
+        r"""Removes all entries and resets the hit and miss counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        r"""
+        Returns the statistics of the cache.
+
+        Returns
+        -------
+        info : dict
+            'hits', 'misses', 'maxsize' and 'currsize' of the cache.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "maxsize": self.maxsize,
+            "currsize": len(self._entries),
+        }
+
+
+def get_solarposition(time, latitude, longitude, method="nrel_numpy"):
+    r"""
+    Calculates the solar position with
+    :func:`pvlib.solarposition.get_solarposition`.
+
+    If a cache is enabled (see :func:`enable_cache` and
+    :func:`solar_position_cache`), identical requests are answered from it.
+
+    Parameters
+    ----------
+    time: pandas.DatetimeIndex
+        Time index for which the solar position is calculated.
+
+    latitude: numeric
+        Latitude of the location.
+
+    longitude: numeric
+        Longitude of the location.
+
+    method: string, default 'nrel_numpy'
+        Calculation method passed to pvlib.
+
+    Returns
+    -------
+    solarposition : pandas.DataFrame
+        Solar position as returned by pvlib.
+    """
+    if _cache is None:
+        return pvlib.solarposition.get_solarposition(
+            time=time, latitude=latitude, longitude=longitude, method=method
+        )
+    return _cache.get(time, latitude, longitude, method=method)
+
+
+def enable_cache(maxsize=32):
+    r"""
+    Enables a module wide solar position cache.
+
+    Parameters
+    ----------
+    maxsize : int
+        Maximum number of cached solar positions. Default: 32.
+
+    Returns
+    -------
+    cache : SolarPositionCache
+        The enabled cache.
+    """
+    global _cache
+    _cache = SolarPositionCache(maxsize=maxsize)
+    return _cache
+
+
+def disable_cache():
+    r"""Disables the module wide solar position cache."""
+    global _cache
+    _cache = None
+
+
+@contextmanager
+def solar_position_cache(maxsize=32):
+    r"""
+    Context manager enabling a solar position cache within its scope.
+
+    Examples
+    --------
+    >>> from oemof.thermal.solar_position import solar_position_cache
+    >>> with solar_position_cache(maxsize=8) as cache:
+    ...     pass  # run flat_plate_precalc, csp_precalc or facades here
+    >>> cache.info()
+    {'hits': 0, 'misses': 0, 'maxsize': 8, 'currsize': 0}
+    """
+    global _cache
+    previous = _cache
+    _cache = SolarPositionCache(maxsize=maxsize)
+    try:
+        yield _cache
+    finally:
+        _cache = previous
@@ -13,9 +13,12 @@ SPDX-License-Identifier: MIT
 """
 
 
+import numpy as np
 import pandas as pd
 import pvlib
 
+from oemof.thermal.solar_position import get_solarposition
+
 
 def flat_plate_precalc(
     lat,
@@ -102,7 +105,7 @@ def flat_plate_precalc(
     # data.set_index('date', inplace=True)
 
     # Calculation of geometrical position of collector with the pvlib
-    solposition = pvlib.solarposition.get_solarposition(
+    solposition = get_solarposition(
         time=data.index, latitude=lat, longitude=long
     )
 
@@ -138,6 +141,121 @@ def flat_plate_precalc(
     return data
 
 
+def flat_plate_precalc_orientations(
+    lat,
+    long,
+    collector_tilt,
+    collector_azimuth,
+    eta_0,
+    a_1,
+    a_2,
+    temp_collector_inlet,
+    delta_temp_n,
+    irradiance_global,
+    irradiance_diffuse,
+    temp_amb,
+):
+    r"""
+    Calculates collectors heat, efficiency and irradiance of a flat plate
+    collector for several orientations at once.
+
+    The solar position and the direct normal irradiance are calculated only
+    once for all orientations. The results are equal to calling
+    :func:`flat_plate_precalc` for every pair of `collector_tilt` and
+    `collector_azimuth`.
+
+    Parameters
+    ----------
+    collector_tilt: array-like of numeric
+        Tilts of the collector orientations.
+
+    collector_azimuth: array-like of numeric
+        Azimuths of the collector orientations (same length as
+        `collector_tilt`). Azimuth according to pvlib in decimal degrees East
+        of North.
+
+    See :func:`flat_plate_precalc` for the other parameters.
+
+    Returns
+    -------
+    data : pandas.DataFrame
+        Time indexed DataFrame with the column levels (quantity,
+        collector_tilt, collector_azimuth), where quantity is one of
+
+        * col_ira: The irradiance on the tilted collector.
+        * eta_c: The efficiency of the collector.
+        * collectors_heat: The heat power output of the collector.
+
+        `data["collectors_heat"]` thus is a (time x orientation) DataFrame.
+    """
+    collector_tilt = np.asarray(collector_tilt, dtype=float).reshape(-1)
+    collector_azimuth = np.asarray(collector_azimuth, dtype=float).reshape(-1)
+    if collector_tilt.shape != collector_azimuth.shape:
+        raise ValueError(
+            "Arguments 'collector_tilt' and 'collector_azimuth' "
+            "have to be of same length!"
+        )
+
+    data = pd.DataFrame(
+        {
+            "ghi": irradiance_global,
+            "dhi": irradiance_diffuse,
+            "temp_amb": temp_amb,
+        }
+    )
+
+    solposition = get_solarposition(
+        time=data.index, latitude=lat, longitude=long
+    )
+
+    dni = pvlib.irradiance.dni(
+        ghi=data["ghi"], dhi=data["dhi"], zenith=solposition["apparent_zenith"]
+    )
+
+    # Orientations along the first axis, time along the second axis
+    total_irradiation = pvlib.irradiance.get_total_irradiance(
+        surface_tilt=collector_tilt[:, np.newaxis],
+        surface_azimuth=collector_azimuth[:, np.newaxis],
+        solar_zenith=solposition["apparent_zenith"].to_numpy()[np.newaxis],
+        solar_azimuth=solposition["azimuth"].to_numpy()[np.newaxis],
+        dni=dni.fillna(0).to_numpy()[np.newaxis],
+        ghi=data["ghi"].to_numpy()[np.newaxis],
+        dhi=data["dhi"].to_numpy()[np.newaxis],
+    )
+    col_ira = np.broadcast_to(
+        total_irradiation["poa_global"], (len(collector_tilt), len(data))
+    )
+
+    delta_t = temp_collector_inlet + delta_temp_n - data["temp_amb"]
+    eta_c = _eta_c_flate_plate(
+        eta_0,
+        a_1,
+        a_2,
+        delta_t.reindex(data.index).to_numpy(dtype=float)[np.newaxis],
+        col_ira,
+    )
+    collectors_heat = eta_c * col_ira
+
+    orientations = pd.MultiIndex.from_arrays(
+        [collector_tilt, collector_azimuth],
+        names=["collector_tilt", "collector_azimuth"],
+    )
+    return pd.concat(
+        {
+            name: pd.DataFrame(
+                values.T, index=data.index, columns=orientations
+            )
+            for name, values in [
+                ("col_ira", col_ira),
+                ("eta_c", eta_c),
+                ("collectors_heat", collectors_heat),
+            ]
+        },
+        axis=1,
+        names=["quantity"],
+    )
+
+
 def calc_eta_c_flate_plate(
     eta_0,
     a_1,
@@ -167,9 +285,9 @@ def calc_eta_c_flate_plate(
         Thermal loss parameter 1.
     a_2: numeric
         Thermal loss parameter 2.
-    temp_collector_inlet: numeric, in °C
+    temp_collector_inlet: numeric or series of numeric, in °C
         Collectors inlet temperature.
-    delta_temp_n: numeric
+    delta_temp_n: numeric or series of numeric
         Temperature difference between collector inlet and mean temperature.
     temp_amb: series of numeric, in °C
         Ambient temperature.
@@ -183,18 +301,30 @@ def calc_eta_c_flate_plate(
 
     """
     delta_t = temp_collector_inlet + delta_temp_n - temp_amb
-    eta_c = pd.Series()
-    for index, value in collector_irradiance.items():
-        if value > 0:
-            eta = (
-                eta_0
-                - a_1 * delta_t[index] / value
-                - a_2 * delta_t[index] ** 2 / value
-            )
-            if eta > 0:
-                eta_c[index] = eta
-            else:
-                eta_c[index] = 0
-        else:
-            eta_c[index] = 0
-    return eta_c
+    if isinstance(delta_t, pd.Series):
+        delta_t = delta_t.reindex(collector_irradiance.index)
+
+    eta_c = _eta_c_flate_plate(
+        eta_0,
+        a_1,
+        a_2,
+        np.asarray(delta_t, dtype=float),
+        collector_irradiance.to_numpy(dtype=float),
+    )
+    return pd.Series(eta_c, index=collector_irradiance.index)
+
+
+def _eta_c_flate_plate(eta_0, a_1, a_2, delta_t, collector_irradiance):
+    r"""
+    Evaluates the collectors efficiency on numpy arrays.
+
+    The arrays are broadcast against each other. The efficiency is set to 0
+    where the irradiance is not positive and is clipped at 0.
+    """
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eta_c = (
+            eta_0
+            - a_1 * delta_t / collector_irradiance
+            - a_2 * delta_t**2 / collector_irradiance
+        )
+    return np.where((collector_irradiance > 0) & (eta_c > 0), eta_c, 0.0)
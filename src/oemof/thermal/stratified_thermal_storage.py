@@ -14,6 +14,9 @@ SPDX-License-Identifier: MIT
 
 
 import numpy as np
+import pandas as pd
+
+from oemof.thermal.fluid_properties import calc_fluid_properties
 
 
 def calculate_storage_u_value(s_iso, lamb_iso, alpha_inside, alpha_outside):
@@ -86,7 +89,12 @@ def calculate_storage_dimensions(height, diameter):
 
 
 def calculate_capacities(
-    volume, temp_h, temp_c, heat_capacity=4195.52, density=971.803
+    volume,
+    temp_h,
+    temp_c,
+    heat_capacity=4195.52,
+    density=971.803,
+    medium=None,
 ):
     r"""
     Calculates the nominal storage capacity, minimum
@@ -98,13 +106,13 @@ def calculate_capacities(
 
     Parameters
     ----------
-    volume :numeric
+    volume :numeric, list, numpy.ndarray or pandas.Series
         Volume of the storage [m3]
 
-    temp_h : numeric
+    temp_h : numeric, list, numpy.ndarray or pandas.Series
         Temperature of hot storage medium [deg C]
 
-    temp_c : numeric
+    temp_c : numeric, list, numpy.ndarray or pandas.Series
         Temperature of cold storage medium [deg C]
 
     heat_capacity: numeric
@@ -117,12 +125,25 @@ def calculate_capacities(
         Default values calculated with CoolProp for a temperature of 80 °C
         as a simplifying assumption
 
+    medium : str (optional)
+        Storage medium, e.g. 'water' (see
+        :func:`~oemof.thermal.fluid_properties.calc_fluid_properties`). If
+        given, `heat_capacity` and `density` are evaluated at the mean of
+        `temp_h` and `temp_c` (per timestep) instead.
+
     Returns
     -------
-    nominal_storage_capacity : numeric
+    nominal_storage_capacity : numeric or numpy.ndarray
         Maximum amount of stored thermal energy [MWh]
 
     """
+    volume, temp_h, temp_c = (
+        np.asarray(value, dtype=float) if isinstance(value, list) else value
+        for value in (volume, temp_h, temp_c)
+    )
+    if medium is not None:
+        heat_capacity, density = _medium_properties(temp_h, temp_c, medium)
+
     nominal_storage_capacity = (
         volume * heat_capacity * density * (temp_h - temp_c)
     )
@@ -132,6 +153,16 @@ def calculate_capacities(
     return nominal_storage_capacity
 
 
+def _medium_properties(temp_h, temp_c, medium):
+    r"""
+    Returns heat capacity and density of `medium` at the mean storage
+    temperature.
+    """
+    return calc_fluid_properties(
+        0.5 * (np.asarray(temp_h) + np.asarray(temp_c)), medium
+    )
+
+
 def calculate_losses(
     u_value,
     diameter,
@@ -141,10 +172,15 @@ def calculate_losses(
     time_increment=1,
     heat_capacity=4195.52,
     density=971.803,
+    nominal_temp_difference=None,
+    medium=None,
 ):
     r"""
     Calculates loss rate and fixed losses for a stratified thermal storage.
 
+    All temperatures may be time series (e.g. the ambient temperature of an
+    outdoor tank), in which case the losses are time series, too.
+
     .. calculate_losses-equations:
 
     :math:`\beta = U \frac{4}{d\rho c}\Delta t`
@@ -161,13 +197,13 @@ def calculate_losses(
     diameter : numeric
         Diameter of the storage [m]
 
-    temp_h : numeric
+    temp_h : numeric, numpy.ndarray or pandas.Series
         Temperature of hot storage medium [deg C]
 
-    temp_c : numeric
+    temp_c : numeric, numpy.ndarray or pandas.Series
         Temperature of cold storage medium [deg C]
 
-    temp_env : numeric
+    temp_env : numeric, numpy.ndarray or pandas.Series
         Temperature outside of the storage [deg C]
 
     time_increment : numeric
@@ -183,6 +219,18 @@ def calculate_losses(
         Default values calculated with CoolProp for a temperature of 80 °C
         as a simplifying assumption
 
+    nominal_temp_difference : numeric (optional)
+        Temperature difference :math:`\Delta T_{HC}` the nominal storage
+        capacity refers to [K]. Default: `temp_h` - `temp_c`. Pass the
+        maximum difference if the temperatures vary over time and the
+        nominal storage capacity is calculated from it.
+
+    medium : str (optional)
+        Storage medium, e.g. 'water' (see
+        :func:`~oemof.thermal.fluid_properties.calc_fluid_properties`). If
+        given, `heat_capacity` and `density` are evaluated at the mean of
+        `temp_h` and `temp_c` (per timestep) instead.
+
     Returns
     -------
 
@@ -198,6 +246,15 @@ def calculate_losses(
         Losses independent of state of charge and independent of
         nominal storage capacity between two consecutive timesteps [MWh]
     """
+    temp_h, temp_c, temp_env = (
+        np.asarray(temp, dtype=float) if isinstance(temp, list) else temp
+        for temp in (temp_h, temp_c, temp_env)
+    )
+    if nominal_temp_difference is None:
+        nominal_temp_difference = temp_h - temp_c
+    if medium is not None:
+        heat_capacity, density = _medium_properties(temp_h, temp_c, medium)
+
     loss_rate = (
         4
         * u_value
@@ -212,7 +269,7 @@ def calculate_losses(
         * u_value
         * (temp_c - temp_env)
         * 1
-        / ((diameter * density * heat_capacity) * (temp_h - temp_c))
+        / ((diameter * density * heat_capacity) * nominal_temp_difference)
         * time_increment
         * 3600  # Ws to Wh
     )
@@ -229,3 +286,421 @@ def calculate_losses(
     fixed_losses_absolute *= 1e-6  # Wh to MWh
 
     return loss_rate, fixed_losses_relative, fixed_losses_absolute
+
+
+def simulate_stratified_storage(
+    height,
+    diameter,
+    u_value,
+    temp_h,
+    temp_c,
+    temp_env,
+    mass_flow_charge,
+    mass_flow_discharge,
+    temp_init=None,
+    n_nodes=100,
+    time_increment=1 / 60,
+    heat_capacity=4195.52,
+    density=971.803,
+    thermal_conductivity=0.65,
+    return_profiles=False,
+):
+    r"""
+    Simulates a stratified thermal storage with a one-dimensional
+    multi-node model.
+
+    The water body is divided into `n_nodes` layers of equal height. Every
+    layer exchanges heat by conduction with its neighbours, loses heat
+    through the envelope (the lateral surface and, for the top and bottom
+    layer, the lids) and is passed by the charging and discharging flows.
+    Charging water enters the top layer at `temp_h` and leaves at the
+    bottom, discharging water enters the bottom layer at `temp_c` and
+    leaves at the top.
+
+    Every timestep is solved with the implicit Euler method, which gives a
+    tridiagonal system of equations. It is solved with LAPACK; the
+    factorization is reused as long as the mass flows do not change.
+
+    .. simulate_stratified_storage-equations:
+
+    :math:`m_i c \frac{T_i^{t+1} - T_i^t}{\Delta t} =
+    \frac{\lambda A}{\Delta z}\left(T_{i-1}^{t+1} - 2 T_i^{t+1}
+    + T_{i+1}^{t+1}\right)
+    - U A_i \left(T_i^{t+1} - T_{env}\right)
+    + \dot m_{ch} c \left(T_{i-1}^{t+1} - T_i^{t+1}\right)
+    + \dot m_{dis} c \left(T_{i+1}^{t+1} - T_i^{t+1}\right)`
+
+    The simulated envelope losses are fitted to the loss model of
+    :func:`calculate_losses` by least squares, which gives an effective
+    U-value and the corresponding loss parameters for the
+    :class:`~oemof.thermal.facades.StratifiedThermalStorage` facade.
+
+    Parameters
+    ----------
+    height : numeric
+        Height of the storage [m]
+
+    diameter : numeric
+        Diameter of the storage [m]
+
+    u_value : numeric
+        Thermal transmittance of storage envelope [W/(m2*K)]
+
+    temp_h : numeric
+        Temperature of the charging water [deg C]
+
+    temp_c : numeric
+        Temperature of the water returning at discharge [deg C]
+
+    temp_env : numeric or array-like
+        Temperature outside of the storage per timestep [deg C]
+
+    mass_flow_charge : numeric or array-like
+        Mass flow of charging water per timestep [kg/s]
+
+    mass_flow_discharge : numeric or array-like
+        Mass flow of discharging water per timestep [kg/s]
+
+    temp_init : numeric or array-like (optional)
+        Initial temperatures of the layers from top to bottom [deg C].
+        Default: `temp_c` (empty storage).
+
+    n_nodes : int
+        Number of layers. Default: 100.
+
+    time_increment : numeric
+        Length of a timestep [h]. Default: 1 minute.
+
+    heat_capacity: numeric
+        Average specific heat capacity of storage medium [J/(kg*K)]
+
+    density : numeric
+        Average density of storage medium [kg/m3]
+
+    thermal_conductivity : numeric
+        Thermal conductivity of the storage medium [W/(m*K)]
+
+    return_profiles : bool
+        If True, the temperatures of all layers are returned for every
+        timestep, otherwise only at the end. Default: False.
+
+    Returns
+    -------
+    results : dict
+        * 'temperatures': Temperatures of the layers at the end of the
+          simulation (n_nodes,) or, with `return_profiles`, at the end of
+          every timestep (timesteps x n_nodes) [deg C]
+        * 'storage_content': Stored heat above `temp_c` [MWh]
+        * 'state_of_charge': Stored heat relative to the nominal storage
+          capacity of :func:`calculate_capacities` [-]
+        * 'heat_charged', 'heat_discharged', 'losses': Heat charged,
+          discharged and lost through the envelope per timestep [MWh]
+        * 'effective_u_value': U-value of the fitted loss model
+          [W/(m2*K)]. `u_value` is returned if the loss model vanishes
+          for all timesteps, e.g. if `temp_env` equals the mean of `temp_h`
+          and `temp_c` at a state of charge of 0.5.
+        * 'loss_rate', 'fixed_losses_relative', 'fixed_losses_absolute':
+          Loss parameters of :func:`calculate_losses` with the effective
+          U-value
+    """
+    temp_env, mass_flow_charge, mass_flow_discharge = np.broadcast_arrays(
+        np.asarray(temp_env, dtype=float),
+        np.asarray(mass_flow_charge, dtype=float),
+        np.asarray(mass_flow_discharge, dtype=float),
+    )
+    if temp_env.ndim != 1:
+        raise ValueError(
+            "At least one of 'temp_env', 'mass_flow_charge' and "
+            "'mass_flow_discharge' has to be a one-dimensional time series."
+        )
+    n_steps = temp_env.size
+
+    # Geometry and constant coefficients of the layers [W/K]
+    dz = height / n_nodes
+    area_cross = 0.25 * np.pi * diameter**2
+    mass = density * area_cross * dz
+    dt = time_increment * 3600  # h to s
+    capacitance = mass * heat_capacity / dt
+    conduction = thermal_conductivity * area_cross / dz if n_nodes > 1 else 0
+    ua = np.full(n_nodes, u_value * np.pi * diameter * dz)
+    ua[0] += u_value * area_cross
+    ua[-1] += u_value * area_cross
+    neighbours = np.full(n_nodes, 2 * conduction)
+    neighbours[[0, -1]] = conduction
+
+    if temp_init is None:
+        temp_init = temp_c
+    temp_init = np.array(
+        np.broadcast_to(np.asarray(temp_init, dtype=float), n_nodes)
+    )
+    temp = temp_init
+
+    top = np.empty(n_steps)
+    bottom = np.empty(n_steps)
+    total = np.empty(n_steps)
+    envelope = np.empty(n_steps)
+    profiles = np.empty((n_steps, n_nodes)) if return_profiles else None
+
+    # Imported here to keep importing this module free of scipy
+    from scipy.linalg.lapack import dgttrs
+
+    key = None
+    for t in range(n_steps):
+        flow_ch = mass_flow_charge[t] * heat_capacity
+        flow_dis = mass_flow_discharge[t] * heat_capacity
+        if key != (flow_ch, flow_dis):
+            key = (flow_ch, flow_dis)
+            factorization = _factorize_layers(
+                capacitance + ua + neighbours + flow_ch + flow_dis,
+                -(conduction + flow_ch),
+                -(conduction + flow_dis),
+            )
+
+        rhs = capacitance * temp + ua * temp_env[t]
+        rhs[0] += flow_ch * temp_h
+        rhs[-1] += flow_dis * temp_c
+        temp, info = dgttrs(*factorization, rhs)
+        if info != 0:
+            raise ValueError(
+                f"Solving the layer temperatures failed (LAPACK dgttrs info "
+                f"{info})."
+            )
+
+        top[t] = temp[0]
+        bottom[t] = temp[-1]
+        total[t] = temp.sum()
+        envelope[t] = ua @ temp
+        if return_profiles:
+            profiles[t] = temp
+
+    to_MWh = dt / 3600 * 1e-6  # W per timestep to MWh
+    volume = calculate_storage_dimensions(height, diameter)[0]
+    nominal_storage_capacity = calculate_capacities(
+        volume, temp_h, temp_c, heat_capacity, density
+    )
+    to_MWh_content = mass * heat_capacity * 1e-6 / 3600  # J/K to MWh/K
+    content_init = np.sum(temp_init - temp_c) * to_MWh_content
+    storage_content = (total - n_nodes * temp_c) * to_MWh_content
+    losses = (envelope - ua.sum() * temp_env) * to_MWh
+    heat_charged = mass_flow_charge * heat_capacity * (temp_h - bottom)
+    heat_discharged = mass_flow_discharge * heat_capacity * (top - temp_c)
+
+    # Least squares fit of the effective U-value: all loss terms of
+    # calculate_losses are proportional to the U-value
+    content_previous = np.concatenate(([content_init], storage_content[:-1]))
+    unit_losses = calculate_losses(
+        1,
+        diameter,
+        temp_h,
+        temp_c,
+        temp_env,
+        time_increment=time_increment,
+        heat_capacity=heat_capacity,
+        density=density,
+    )
+    modelled = (
+        unit_losses[0] * content_previous
+        + unit_losses[1] * nominal_storage_capacity
+        + unit_losses[2]
+    )
+    if np.dot(modelled, modelled) > 0:
+        effective_u_value = np.dot(modelled, losses) / np.dot(
+            modelled, modelled
+        )
+    else:
+        # The loss model vanishes, e.g. if the environment is as warm as the
+        # mean storage temperature, so the U-value cannot be fitted
+        effective_u_value = u_value
+
+    results = {
+        "temperatures": profiles if return_profiles else temp,
+        "storage_content": storage_content,
+        "state_of_charge": storage_content / nominal_storage_capacity,
+        "heat_charged": heat_charged * to_MWh,
+        "heat_discharged": heat_discharged * to_MWh,
+        "losses": losses,
+        "effective_u_value": effective_u_value,
+    }
+    results.update(
+        zip(
+            ["loss_rate", "fixed_losses_relative", "fixed_losses_absolute"],
+            calculate_losses(
+                effective_u_value,
+                diameter,
+                temp_h,
+                temp_c,
+                temp_env,
+                time_increment=time_increment,
+                heat_capacity=heat_capacity,
+                density=density,
+            ),
+        )
+    )
+    return results
+
+
+def _factorize_layers(diagonal, lower, upper):
+    r"""
+    Returns the LU factorization of the tridiagonal matrix of the layers for
+    :func:`scipy.linalg.lapack.dgttrs`.
+    """
+    from scipy.linalg.lapack import dgttrf
+
+    n_nodes = np.size(diagonal)
+    *factorization, info = dgttrf(
+        np.full(n_nodes - 1, lower, dtype=float),
+        np.array(diagonal, dtype=float),
+        np.full(n_nodes - 1, upper, dtype=float),
+    )
+    if info != 0:
+        raise ValueError(
+            f"The matrix of the layers is singular (LAPACK dgttrf info "
+            f"{info}). Please check the storage parameters."
+        )
+    return factorization
+
+
+def size_storages(
+    height,
+    diameter,
+    temp_h,
+    temp_c,
+    s_iso,
+    lamb_iso,
+    alpha_inside,
+    alpha_outside,
+    temp_env,
+    time_increment=1,
+    heat_capacity=4195.52,
+    density=971.803,
+    pareto_only=False,
+):
+    r"""
+    Evaluates the geometry, capacity and losses of stratified thermal
+    storages for all combinations of the given parameter grids.
+
+    Every grid is placed on its own axis and all combinations are evaluated
+    in one broadcast call of :func:`calculate_storage_dimensions`,
+    :func:`calculate_capacities`, :func:`calculate_storage_u_value` and
+    :func:`calculate_losses`. Combinations with `temp_h` <= `temp_c` are
+    skipped.
+
+    A combination is Pareto optimal if no other combination has a larger
+    nominal storage capacity and lower losses at full charge.
+
+    Parameters
+    ----------
+    height, diameter : numeric or 1-D array-like
+        Grids of heights and diameters of the storage [m]
+
+    temp_h, temp_c : numeric or 1-D array-like
+        Grids of temperatures of hot and cold storage medium [deg C]
+
+    s_iso, lamb_iso : numeric or 1-D array-like
+        Grids of thickness [mm] and thermal conductivity [W/(m*K)] of the
+        isolation layer
+
+    alpha_inside, alpha_outside : numeric
+        Heat transfer coefficients at the inner and outer surface of the
+        storage [W/(m2*K)]
+
+    temp_env : numeric
+        Temperature outside of the storage [deg C]
+
+    time_increment, heat_capacity, density : numeric
+        See :func:`calculate_losses`.
+
+    pareto_only : bool
+        If True, only the Pareto optimal combinations are returned.
+        Default: False.
+
+    Returns
+    -------
+    table : pandas.DataFrame
+        One row per combination with the parameters and the columns
+        'volume', 'surface', 'nominal_storage_capacity', 'u_value',
+        'loss_rate', 'fixed_losses_relative', 'fixed_losses_absolute',
+        'losses_full' (losses between two timesteps at full charge [MWh])
+        and 'pareto_optimal'.
+    """
+    grids = {
+        "height": height,
+        "diameter": diameter,
+        "temp_h": temp_h,
+        "temp_c": temp_c,
+        "s_iso": s_iso,
+        "lamb_iso": lamb_iso,
+    }
+    shape = [np.size(grid) for grid in grids.values()]
+    for axis, (name, grid) in enumerate(grids.items()):
+        axis_shape = [1] * len(grids)
+        axis_shape[axis] = -1
+        grids[name] = np.reshape(np.asarray(grid, dtype=float), axis_shape)
+
+    valid = np.broadcast_to(grids["temp_h"] > grids["temp_c"], shape)
+    params = {
+        name: np.broadcast_to(grid, shape) for name, grid in grids.items()
+    }
+
+    volume, surface = calculate_storage_dimensions(
+        grids["height"], grids["diameter"]
+    )
+    nominal_storage_capacity = calculate_capacities(
+        volume, grids["temp_h"], grids["temp_c"], heat_capacity, density
+    )
+    u_value = calculate_storage_u_value(
+        grids["s_iso"], grids["lamb_iso"], alpha_inside, alpha_outside
+    )
+    with np.errstate(divide="ignore", invalid="ignore"):
+        losses = calculate_losses(
+            u_value,
+            grids["diameter"],
+            grids["temp_h"],
+            grids["temp_c"],
+            temp_env,
+            time_increment=time_increment,
+            heat_capacity=heat_capacity,
+            density=density,
+        )
+    columns = {
+        **params,
+        "volume": volume,
+        "surface": surface,
+        "nominal_storage_capacity": nominal_storage_capacity,
+        "u_value": u_value,
+        "loss_rate": losses[0],
+        "fixed_losses_relative": losses[1],
+        "fixed_losses_absolute": losses[2],
+        "losses_full": (losses[0] + losses[1]) * nominal_storage_capacity
+        + losses[2],
+    }
+    table = pd.DataFrame(
+        {
+            name: np.broadcast_to(values, shape)[valid]
+            for name, values in columns.items()
+        }
+    )
+
+    table["pareto_optimal"] = _pareto_optimal(
+        table["nominal_storage_capacity"].to_numpy(),
+        table["losses_full"].to_numpy(),
+    )
+    if pareto_only:
+        table = table[table["pareto_optimal"]].reset_index(drop=True)
+    return table
+
+
+def _pareto_optimal(capacity, losses):
+    r"""
+    Returns a mask of the combinations for which no other combination has a
+    larger (or equal) capacity and lower losses.
+    """
+    # Sort by decreasing capacity and, for equal capacity, increasing losses
+    order = np.lexsort((losses, -capacity))
+    sorted_losses = losses[order]
+    previous_minimum = np.minimum.accumulate(
+        np.concatenate(([np.inf], sorted_losses[:-1]))
+    )
+    mask = np.empty(capacity.size, dtype=bool)
+    mask[order] = sorted_losses < previous_minimum
+    return mask
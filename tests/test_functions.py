@@ -1,22 +1,47 @@
 import os
+import pickle
 
 import numpy as np
 import pandas as pd
+import pvlib
 import pytest
 from pytest import approx
 
 import oemof.thermal.absorption_heatpumps_and_chillers as ac
 import oemof.thermal.compression_heatpumps_and_chillers as cmpr_hp_chllr
 import oemof.thermal.concentrating_solar_power as csp
+from oemof import solph
+from oemof.thermal import solar_position
+from oemof.thermal._helpers import fingerprint
 from oemof.thermal.cogeneration import allocate_emissions
+from oemof.thermal.cogeneration import allocate_emissions_from_results
+from oemof.thermal.cogeneration import allocate_emissions_portfolio
+from oemof.thermal.concentrating_solar_power import csp_precalc
+from oemof.thermal.facades import ParabolicTroughCollector
+from oemof.thermal.facades import SolarThermalCollector
+from oemof.thermal.facades import StratifiedThermalStorage
+from oemof.thermal.facades import _precalc_cache
+from oemof.thermal.facades import add_facades
+from oemof.thermal.facades import clear_precalc_cache
+from oemof.thermal.facades import facades_from_frame
+from oemof.thermal.fluid_properties import available_media
+from oemof.thermal.fluid_properties import calc_fluid_properties
+from oemof.thermal.parallel import precalc_sites
 from oemof.thermal.solar_thermal_collector import calc_eta_c_flate_plate
 from oemof.thermal.solar_thermal_collector import flat_plate_precalc
+from oemof.thermal.solar_thermal_collector import (
+    flat_plate_precalc_orientations,
+)
 from oemof.thermal.stratified_thermal_storage import calculate_capacities
 from oemof.thermal.stratified_thermal_storage import calculate_losses
 from oemof.thermal.stratified_thermal_storage import (
     calculate_storage_dimensions,
 )
 from oemof.thermal.stratified_thermal_storage import calculate_storage_u_value
+from oemof.thermal.stratified_thermal_storage import (
+    simulate_stratified_storage,
+)
+from oemof.thermal.stratified_thermal_storage import size_storages
 
 
 def test_cop_calculation_hp():
@@ -35,7 +60,12 @@ def test_calc_cops_with_Series_01():
         quality_grade=0.4,
         mode="heat_pump",
     )
-    assert cops_HP == [4.473571428571428, 4.473571428571428, 4.473571428571428]
+    assert cops_HP.equals(
+        pd.Series(
+            [4.473571428571428, 4.473571428571428, 4.473571428571428],
+            index=temp_l_series.index,
+        )
+    )
 
 
 def test_calc_cops_with_Series_02():
@@ -47,7 +77,44 @@ def test_calc_cops_with_Series_02():
         quality_grade=0.4,
         mode="heat_pump",
     )
-    assert cops_HP == [4.473571428571428, 4.473571428571428, 4.473571428571428]
+    assert cops_HP.equals(
+        pd.Series(
+            [4.473571428571428, 4.473571428571428, 4.473571428571428],
+            index=temp_h_series.index,
+        )
+    )
+
+
+def test_calc_cops_with_scalars():
+    cop_HP = cmpr_hp_chllr.calc_cops(
+        temp_high=40, temp_low=12, quality_grade=0.4, mode="heat_pump"
+    )
+    assert cop_HP == 4.473571428571428
+
+
+def test_calc_cops_with_arrays_and_icing():
+    temp_low = np.array([1.3, 2.3, -5, 12])
+    cops_ASHP = cmpr_hp_chllr.calc_cops(
+        temp_high=np.array([40]),
+        temp_low=temp_low,
+        quality_grade=0.5,
+        mode="heat_pump",
+        temp_threshold_icing=2,
+        factor_icing=0.8,
+    )
+    expected = [
+        cmpr_hp_chllr.calc_cops(
+            temp_high=[40],
+            temp_low=[t],
+            quality_grade=0.5,
+            mode="heat_pump",
+            temp_threshold_icing=2,
+            factor_icing=0.8,
+        )[0]
+        for t in temp_low
+    ]
+    assert isinstance(cops_ASHP, np.ndarray)
+    assert cops_ASHP.tolist() == expected
 
 
 def test_cop_calculation_hp_list_input_01():
@@ -96,11 +163,11 @@ def test_cop_calculation_chiller():
 
 
 def test_raised_exception_01():
-    """Test if an exception is raised if temp_low is not a list."""
+    """Test if an exception is raised if temp_low is not numeric."""
     with pytest.raises(TypeError):
         cmpr_hp_chllr.calc_cops(
             temp_high=[40],
-            temp_low=12,  # ERROR - temp_low has to be a list!
+            temp_low="12",  # ERROR - temp_low has to be numeric!
             quality_grade=0.4,
             mode="heat_pump",
             temp_threshold_icing=2,
@@ -109,10 +176,10 @@ def test_raised_exception_01():
 
 
 def test_raised_exception_02():
-    """Test if an exception is raised if temp_high is not a list."""
+    """Test if an exception is raised if temp_high is not numeric."""
     with pytest.raises(TypeError):
         cmpr_hp_chllr.calc_cops(
-            temp_high=40,  # ERROR - temp_high has to be a list!
+            temp_high="40",  # ERROR - temp_high has to be numeric!
             temp_low=[12],
             quality_grade=0.4,
             mode="heat_pump",
@@ -235,6 +302,15 @@ def test_calculate_capacities():
     assert nominal_storage_capacity == 56.62804059111111
 
 
+def test_calculate_capacities_list_input():
+    nominal_storage_capacity = calculate_capacities(
+        [1000, 500], [100, 90], [50, 60]
+    )
+    assert nominal_storage_capacity.tolist() == approx(
+        [56.62804059111111, 16.988412177333333]
+    )
+
+
 def test_calculate_losses():
     params = {
         "u_value": 1,  # W/(m2*K)
@@ -254,6 +330,679 @@ def test_calculate_losses():
     )
 
 
+def test_calculate_losses_time_varying():
+    """Test if time-varying temperatures give the losses per timestep."""
+    temp_env = pd.Series([10.0, 0.0, -10.0])
+    losses = calculate_losses(
+        u_value=1, diameter=10, temp_h=100, temp_c=50, temp_env=temp_env
+    )
+    for i, temp in enumerate(temp_env):
+        expected = calculate_losses(
+            u_value=1, diameter=10, temp_h=100, temp_c=50, temp_env=temp
+        )
+        assert losses[1][i] == approx(expected[1])
+        assert losses[2][i] == approx(expected[2])
+    assert losses[0] == approx(0.0003531819182021882)
+
+    losses = calculate_losses(
+        u_value=1,
+        diameter=10,
+        temp_h=[100.0, 90.0],
+        temp_c=50,
+        temp_env=10,
+        nominal_temp_difference=50,
+    )
+    assert losses[1] == approx(0.00028254553456175054)
+    assert losses[2].shape == (2,)
+
+
+def test_stratified_thermal_storage_facade_time_varying():
+    """Test if the storage facade accepts time-varying temperatures."""
+    temp_env = pd.Series([10.0, 0.0, -10.0])
+    temp_h = np.array([95.0, 90.0, 85.0])
+    storage = StratifiedThermalStorage(
+        label="thermal_storage",
+        bus=solph.Bus(label="heat"),
+        diameter=10,
+        height=10,
+        temp_h=temp_h,
+        temp_c=60,
+        temp_env=temp_env,
+        u_value=0.3,
+        capacity=1,
+    )
+    losses = calculate_losses(
+        0.3, 10, temp_h, 60, temp_env, nominal_temp_difference=35
+    )
+    for actual, expected in zip(
+        [
+            storage.loss_rate,
+            storage.fixed_losses_relative,
+            storage.fixed_losses_absolute,
+        ],
+        losses,
+    ):
+        assert np.broadcast_to(actual[:3], 3) == approx(
+            np.broadcast_to(expected, 3)
+        )
+    assert storage.nominal_storage_capacity == approx(
+        calculate_capacities(
+            calculate_storage_dimensions(10, 10)[0], temp_h=95, temp_c=60
+        )
+    )
+
+
+def test_simulate_stratified_storage():
+    """Test the energy balance and the fitted loss parameters of the
+    multi-node storage simulation."""
+    steps = np.arange(600)
+    results = simulate_stratified_storage(
+        height=10,
+        diameter=5,
+        u_value=0.3,
+        temp_h=90,
+        temp_c=50,
+        temp_env=10,
+        mass_flow_charge=np.where(steps < 200, 2.0, 0.0),
+        mass_flow_discharge=np.where(steps >= 400, 1.0, 0.0),
+        n_nodes=50,
+    )
+    balance = (
+        results["heat_charged"].sum()
+        - results["heat_discharged"].sum()
+        - results["losses"].sum()
+    )
+    assert results["storage_content"][-1] == approx(balance)
+    assert results["temperatures"].shape == (50,)
+    assert results["temperatures"][0] > results["temperatures"][-1]
+    assert results["effective_u_value"] == approx(0.3, rel=0.1)
+    assert results["loss_rate"] == approx(
+        calculate_losses(
+            results["effective_u_value"], 5, 90, 50, 10, time_increment=1 / 60
+        )[0]
+    )
+
+    # Without flows and losses the temperatures do not change
+    results = simulate_stratified_storage(
+        height=10,
+        diameter=5,
+        u_value=0.3,
+        temp_h=90,
+        temp_c=50,
+        temp_env=70,
+        mass_flow_charge=np.zeros(10),
+        mass_flow_discharge=0,
+        temp_init=70,
+        n_nodes=5,
+        return_profiles=True,
+    )
+    assert results["temperatures"].shape == (10, 5)
+    assert results["temperatures"] == approx(np.full((10, 5), 70.0))
+    assert results["state_of_charge"] == approx(np.full(10, 0.5))
+    # The loss model vanishes, so the given U-value is returned
+    assert results["effective_u_value"] == 0.3
+    assert np.isfinite(results["loss_rate"])
+
+
+def test_size_storages():
+    """Test the sizing sweep against the single storage functions and the
+    Pareto filter against a pairwise comparison."""
+    table = size_storages(
+        height=[5, 10, 15],
+        diameter=[4, 8],
+        temp_h=[80, 95],
+        temp_c=[60, 85],
+        s_iso=[100, 200],
+        lamb_iso=0.03,
+        alpha_inside=1,
+        alpha_outside=1,
+        temp_env=10,
+    )
+    assert len(table) == 3 * 2 * 3 * 2
+    row = table.iloc[-1]
+    volume, surface = calculate_storage_dimensions(15, 8)
+    u_value = calculate_storage_u_value(200, 0.03, 1, 1)
+    losses = calculate_losses(u_value, 8, 95, 85, 10)
+    assert (row["height"], row["temp_h"], row["temp_c"]) == (15, 95, 85)
+    assert row["volume"] == approx(volume)
+    assert row["surface"] == approx(surface)
+    assert row["nominal_storage_capacity"] == approx(
+        calculate_capacities(volume, 95, 85)
+    )
+    assert row["u_value"] == approx(u_value)
+    assert row[
+        ["loss_rate", "fixed_losses_relative", "fixed_losses_absolute"]
+    ].tolist() == approx(list(losses))
+
+    capacity = table["nominal_storage_capacity"].to_numpy()
+    losses_full = table["losses_full"].to_numpy()
+    dominated = [
+        np.any(
+            (capacity >= capacity[i]) & (losses_full < losses_full[i])
+            | (capacity > capacity[i]) & (losses_full <= losses_full[i])
+        )
+        for i in range(len(table))
+    ]
+    assert table["pareto_optimal"].tolist() == [not d for d in dominated]
+
+    front = size_storages(
+        [5, 10, 15],
+        [4, 8],
+        95,
+        60,
+        [100, 200],
+        0.03,
+        1,
+        1,
+        10,
+        pareto_only=True,
+    )
+    assert front["pareto_optimal"].all()
+
+
+def test_calc_fluid_properties():
+    """Test the interpolation in the property table of storage media."""
+    assert set(available_media()) >= {"water", "MEG-30%", "MPG-30%"}
+    assert calc_fluid_properties(80) == approx((4196.871, 971.766))
+    heat_capacity, density = calc_fluid_properties([79.5, 80], "water")
+    assert heat_capacity[0] == approx(
+        0.5 * (calc_fluid_properties(79)[0] + calc_fluid_properties(80)[0])
+    )
+    assert density[1] == approx(971.766)
+    assert calc_fluid_properties(20, "MEG-30%")[1] > density[1]
+    with pytest.raises(ValueError):
+        calc_fluid_properties(200)
+    with pytest.raises(ValueError):
+        calc_fluid_properties(20, "mercury")
+
+
+def test_storage_functions_with_medium():
+    """Test if the storage functions evaluate the properties of a medium at
+    the mean temperature."""
+    heat_capacity, density = calc_fluid_properties(75)
+    assert calculate_capacities(1000, 100, 50, medium="water") == approx(
+        calculate_capacities(1000, 100, 50, heat_capacity, density)
+    )
+    losses = calculate_losses(
+        1, 10, np.array([100, 60]), 50, 10, medium="water"
+    )
+    expected = calculate_losses(
+        1,
+        10,
+        60,
+        50,
+        10,
+        heat_capacity=calc_fluid_properties(55)[0],
+        density=calc_fluid_properties(55)[1],
+    )
+    assert losses[0][1] == approx(expected[0])
+    assert losses[1][1] == approx(expected[1])
+
+    storage = StratifiedThermalStorage(
+        label="thermal_storage",
+        bus=solph.Bus(label="heat"),
+        diameter=10,
+        height=10,
+        temp_h=95,
+        temp_c=55,
+        temp_env=10,
+        u_value=0.3,
+        capacity=1,
+        medium="water",
+    )
+    assert storage.nominal_storage_capacity == approx(
+        calculate_capacities(
+            calculate_storage_dimensions(10, 10)[0], 95, 55, medium="water"
+        )
+    )
+
+
+def test_add_facades():
+    """Test if facades are added in bulk without one signal subscription
+    per facade."""
+    signal = solph.EnergySystem.signals[solph.EnergySystem.add]
+    receivers = len(signal.receivers)
+    energysystem = solph.EnergySystem(
+        timeindex=pd.date_range("1/1/2020", periods=3, freq="h"),
+        infer_last_interval=True,
+    )
+    bus_heat = solph.Bus(label="heat")
+    storages = add_facades(
+        energysystem,
+        (
+            StratifiedThermalStorage(
+                label=f"thermal_storage_{i}",
+                bus=bus_heat,
+                diameter=10,
+                height=10,
+                temp_h=95,
+                temp_c=60,
+                temp_env=10,
+                u_value=0.3,
+                capacity=1,
+            )
+            for i in range(10)
+        ),
+    )
+    assert len(storages) == 10
+    assert set(storages) <= set(energysystem.nodes)
+    assert len(signal.receivers) == receivers
+
+
+def test_solar_thermal_collector_facade_lazy_memoize():
+    """Test if the precalculation of collector facades is deferred and
+    shared between identical collectors."""
+    timeindex = pd.date_range(
+        "1/2/2003 09:00", periods=3, freq="h", tz="Europe/Berlin"
+    )
+    bus_heat = solph.Bus(label="heat")
+    bus_el = solph.Bus(label="electricity")
+    cache = {}
+    collectors = [
+        SolarThermalCollector(
+            label=f"solar_collector_{i}",
+            heat_out_bus=bus_heat,
+            electricity_in_bus=bus_el,
+            electrical_consumption=0.02,
+            peripheral_losses=0.05,
+            aperture_area=1000,
+            latitude=52.2443,
+            longitude=10.5594,
+            collector_tilt=10,
+            collector_azimuth=20,
+            eta_0=0.73,
+            a_1=1.7,
+            a_2=0.016,
+            temp_collector_inlet=20,
+            delta_temp_n=10,
+            irradiance_global=pd.Series([47, 132, 131], index=timeindex),
+            irradiance_diffuse=pd.Series([37.6, 69.7, 98.9], index=timeindex),
+            temp_amb=pd.Series([4, 6, 8], index=timeindex),
+            lazy=True,
+            memoize=cache,
+        )
+        for i in range(3)
+    ]
+    assert all(c._precalc_data is None for c in collectors)
+    assert not cache
+
+    energysystem = solph.EnergySystem(
+        timeindex=timeindex, infer_last_interval=True
+    )
+    energysystem.add(bus_heat, bus_el, *collectors[:2])
+    assert len(cache) == 1
+    assert collectors[0].precalc_data is collectors[1].precalc_data
+    assert len(collectors[0].subnodes) == 1
+    assert collectors[0].subnodes[0] in energysystem.nodes
+    assert collectors[2]._precalc_data is None
+
+
+def test_precalc_cache_list_input_and_bound():
+    """Test if list arguments can be memoized and if the module level
+    cache of the precalculations is bounded."""
+    key = fingerprint([20, [22, 24], np.array([1.0, 2.0])])
+    assert hash(key) == hash(fingerprint([20, [22, 24], np.array([1, 2.0])]))
+    assert key != fingerprint([20, [22, 25], np.array([1.0, 2.0])])
+
+    clear_precalc_cache()
+    for i in range(_precalc_cache.maxsize + 1):
+        _precalc_cache[i] = i
+    assert len(_precalc_cache) == _precalc_cache.maxsize
+    assert 0 not in _precalc_cache
+    clear_precalc_cache()
+
+
+def test_facades_from_frame_storages():
+    """Test if storages created from a table equal storages created one
+    by one."""
+    bus_heat = solph.Bus(label="heat")
+    table = pd.DataFrame(
+        {
+            "label": ["storage_a", "storage_b", "storage_c"],
+            "bus": ["heat", "heat", "heat"],
+            "diameter": [10, 8, 12],
+            "height": [10, 6, np.nan],
+            "temp_h": [95, 90, 80],
+            "temp_c": [60, 55, 50],
+            "temp_env": [10, 10, 5],
+            "u_value": [0.3, 0.25, 0.4],
+            "capacity": [1, 1, np.nan],
+            "expandable": [False, False, True],
+            "storage_capacity_cost": [np.nan, np.nan, 400],
+            "capacity_cost": [np.nan, np.nan, 50],
+        }
+    )
+    storages = facades_from_frame(
+        StratifiedThermalStorage, table, buses={"heat": bus_heat}
+    )
+    assert [s.label for s in storages] == list(table["label"])
+    assert all(s.bus is bus_heat for s in storages)
+
+    for storage, row in zip(storages, table.to_dict("records")):
+        reference = StratifiedThermalStorage(
+            bus=bus_heat,
+            **{
+                key: value
+                for key, value in row.items()
+                if key != "bus" and not pd.isna(value)
+            },
+        )
+        assert storage.loss_rate[0] == approx(reference.loss_rate[0])
+        assert storage.fixed_losses_relative[0] == approx(
+            reference.fixed_losses_relative[0]
+        )
+        assert storage.fixed_losses_absolute[0] == approx(
+            reference.fixed_losses_absolute[0]
+        )
+        assert storage.nominal_storage_capacity == approx(
+            reference.nominal_storage_capacity
+        )
+        storage.update()
+        assert storage.nominal_storage_capacity == approx(
+            reference.nominal_storage_capacity
+        )
+
+    # A capacity calculated by the factory follows the dimensions on update
+    # like the one of a storage which is created directly
+    storage, reference = storages[0], StratifiedThermalStorage(
+        bus=bus_heat, **table.iloc[0].drop("bus").dropna().to_dict()
+    )
+    for facade in (storage, reference):
+        facade.height = 20
+        facade.update()
+    assert storage.nominal_storage_capacity == approx(
+        reference.nominal_storage_capacity
+    )
+    assert storage.nominal_storage_capacity == approx(
+        calculate_capacities(calculate_storage_dimensions(20, 10)[0], 95, 60)
+    )
+
+
+def test_stratified_thermal_storage_facade_given_losses():
+    """Test if given losses and nominal storage capacity are used by the
+    facade instead of the calculated ones."""
+    storage = StratifiedThermalStorage(
+        label="thermal_storage",
+        bus=solph.Bus(label="heat"),
+        diameter=10,
+        temp_h=95,
+        temp_c=60,
+        temp_env=10,
+        u_value=0.3,
+        capacity=1,
+        loss_rate=0.001,
+        nominal_storage_capacity=100,
+    )
+    losses = calculate_losses(0.3, 10, 95, 60, 10)
+    assert storage.loss_rate[0] == 0.001
+    assert storage.fixed_losses_relative[0] == approx(losses[1])
+    assert storage.fixed_losses_absolute[0] == approx(losses[2])
+    assert storage.nominal_storage_capacity == 100
+    storage.update()
+    assert storage.nominal_storage_capacity == 100
+
+    storage.nominal_storage_capacity = 200
+    storage.update()
+    assert storage.nominal_storage_capacity == 200
+    assert storage.inputs[storage.bus].nominal_value == 1
+
+
+def test_stratified_thermal_storage_facade_update_recalculates():
+    """Test if a calculated nominal storage capacity follows the
+    dimensions of the storage on update."""
+    storage = StratifiedThermalStorage(
+        label="thermal_storage",
+        bus=solph.Bus(label="heat"),
+        diameter=10,
+        height=10,
+        temp_h=95,
+        temp_c=60,
+        temp_env=10,
+        u_value=0.3,
+        capacity=1,
+    )
+    storage.height = 20
+    storage.update()
+    volume = calculate_storage_dimensions(20, 10)[0]
+    assert storage.nominal_storage_capacity == approx(
+        calculate_capacities(volume, 95, 60)
+    )
+
+
+def test_facades_from_frame_missing_columns():
+    """Test if missing columns are reported once for the whole table."""
+    table = pd.DataFrame({"label": ["storage"], "diameter": [10]})
+    with pytest.raises(KeyError, match="temp_h"):
+        facades_from_frame(
+            StratifiedThermalStorage, table, bus=solph.Bus(label="heat")
+        )
+
+    table = pd.DataFrame(
+        {
+            "label": ["storage_a", "storage_b"],
+            "diameter": [10, 8],
+            "temp_h": [95, np.nan],
+            "temp_c": [60, 55],
+            "temp_env": [10, 10],
+            "u_value": [0.3, 0.25],
+        }
+    )
+    with pytest.raises(KeyError, match="'temp_h' of row 1"):
+        facades_from_frame(
+            StratifiedThermalStorage, table, bus=solph.Bus(label="heat")
+        )
+
+
+def test_facades_from_frame_subclass():
+    """Test if subclasses of the facades are accepted and validated with
+    the requirements of the facade class."""
+
+    class TankStorage(StratifiedThermalStorage):
+        _facade_requires_ = StratifiedThermalStorage._facade_requires_ + [
+            "height"
+        ]
+
+    table = pd.DataFrame(
+        {
+            "label": ["tank"],
+            "diameter": [10],
+            "temp_h": [95],
+            "temp_c": [60],
+            "temp_env": [10],
+            "u_value": [0.3],
+        }
+    )
+    with pytest.raises(KeyError, match="height"):
+        facades_from_frame(TankStorage, table, bus=solph.Bus(label="heat"))
+
+    table["height"] = 10
+    (tank,) = facades_from_frame(
+        TankStorage, table, bus=solph.Bus(label="heat")
+    )
+    assert isinstance(tank, TankStorage)
+
+    with pytest.raises(ValueError, match="not supported"):
+        facades_from_frame(solph.Bus, table)
+
+
+def test_facades_from_frame_collectors_share_precalc():
+    """Test if collectors of the same site share one precalculation."""
+    timeindex = pd.date_range(
+        "1/2/2003 09:00", periods=3, freq="h", tz="Europe/Berlin"
+    )
+    weather = {
+        site: {
+            "irradiance_global": pd.Series(ghi, index=timeindex),
+            "irradiance_diffuse": pd.Series(
+                [37.6, 69.7, 98.9], index=timeindex
+            ),
+            "temp_amb": pd.Series([4, 6, 8], index=timeindex),
+        }
+        for site, ghi in [("north", [47, 132, 131]), ("south", [57, 142, 141])]
+    }
+    table = pd.DataFrame(
+        {
+            "label": [f"solar_collector_{i}" for i in range(4)],
+            "site": ["north", "north", "south", "south"],
+            "aperture_area": [1000, 500, 1000, 200],
+        }
+    )
+    collectors = facades_from_frame(
+        SolarThermalCollector,
+        table,
+        weather=weather,
+        heat_out_bus=solph.Bus(label="heat"),
+        electricity_in_bus=solph.Bus(label="electricity"),
+        electrical_consumption=0.02,
+        peripheral_losses=0.05,
+        latitude=52.2443,
+        longitude=10.5594,
+        collector_tilt=10,
+        collector_azimuth=20,
+        eta_0=0.73,
+        a_1=1.7,
+        a_2=0.016,
+        temp_collector_inlet=20,
+        delta_temp_n=10,
+    )
+    assert collectors[0].precalc_data is collectors[1].precalc_data
+    assert collectors[2].precalc_data is collectors[3].precalc_data
+    assert collectors[0].precalc_data is not collectors[2].precalc_data
+    assert collectors[1].aperture_area == 500
+
+
+def test_facades_from_frame_collectors_grouped_by_site(monkeypatch):
+    """Test if collectors of one site with different orientations get the
+    results of single precalculations from one solar position
+    calculation."""
+    timeindex = pd.date_range(
+        "1/2/2003 09:00", periods=3, freq="h", tz="Europe/Berlin"
+    )
+    flat_plate_weather = {
+        "irradiance_global": pd.Series([47, 132, 131], index=timeindex),
+        "irradiance_diffuse": pd.Series([37.6, 69.7, 98.9], index=timeindex),
+        "temp_amb": pd.Series([4, 6, 8], index=timeindex),
+    }
+    csp_weather = {
+        "irradiance": pd.Series([400, 600, 700], index=timeindex),
+        "temp_amb": pd.Series([24, 26, 28], index=timeindex),
+    }
+    calls = []
+    get_solarposition = pvlib.solarposition.get_solarposition
+
+    def counting_get_solarposition(*args, **kwargs):
+        calls.append(kwargs["latitude"])
+        return get_solarposition(*args, **kwargs)
+
+    monkeypatch.setattr(
+        pvlib.solarposition, "get_solarposition", counting_get_solarposition
+    )
+
+    flat_plate = {
+        "latitude": 52.2443,
+        "longitude": 10.5594,
+        "eta_0": 0.73,
+        "a_1": 1.7,
+        "a_2": 0.016,
+        "temp_collector_inlet": 20,
+        "delta_temp_n": 10,
+    }
+    table = pd.DataFrame(
+        {
+            "label": [f"solar_collector_{i}" for i in range(4)],
+            "site": "north",
+            "collector_tilt": [10, 20, 30, 10],
+            "collector_azimuth": [20, 20, 180, 20],
+        }
+    )
+    collectors = facades_from_frame(
+        SolarThermalCollector,
+        table,
+        weather={"north": flat_plate_weather},
+        heat_out_bus=solph.Bus(label="heat"),
+        electricity_in_bus=solph.Bus(label="electricity"),
+        electrical_consumption=0.02,
+        peripheral_losses=0.05,
+        aperture_area=1000,
+        **flat_plate,
+    )
+    assert len(calls) == 1
+    assert collectors[0].precalc_data is collectors[3].precalc_data
+    for collector, row in zip(collectors, table.to_dict("records")):
+        expected = flat_plate_precalc(
+            flat_plate["latitude"],
+            flat_plate["longitude"],
+            row["collector_tilt"],
+            row["collector_azimuth"],
+            flat_plate["eta_0"],
+            flat_plate["a_1"],
+            flat_plate["a_2"],
+            flat_plate["temp_collector_inlet"],
+            flat_plate["delta_temp_n"],
+            **flat_plate_weather,
+        )
+        assert collector.collectors_heat.tolist() == approx(
+            expected["collectors_heat"].tolist()
+        )
+        assert len(collector.subnodes) == 1
+
+    csp = {
+        "latitude": 23.614328,
+        "longitude": 58.545284,
+        "collector_azimuth": 180,
+        "cleanliness": 0.9,
+        "a_1": -0.00159,
+        "a_2": 0.0000977,
+        "eta_0": 0.816,
+        "c_1": 0.0622,
+        "c_2": 0.00023,
+        "temp_collector_inlet": 435,
+        "temp_collector_outlet": 500,
+    }
+    table = pd.DataFrame(
+        {
+            "label": ["csp_0", "csp_1"],
+            "site": "south",
+            "collector_tilt": [10, 20],
+        }
+    )
+    collectors = facades_from_frame(
+        ParabolicTroughCollector,
+        table,
+        weather={"south": csp_weather},
+        heat_bus=solph.Bus(label="heat"),
+        electrical_bus=solph.Bus(label="electricity"),
+        electrical_consumption=0.05,
+        additional_losses=0.2,
+        aperture_area=1000,
+        loss_method="Janotte",
+        irradiance_method="horizontal",
+        **csp,
+    )
+    assert calls[-1] == csp["latitude"]
+    assert calls.count(csp["latitude"]) == 1
+    for collector, tilt in zip(collectors, table["collector_tilt"]):
+        expected = csp_precalc(
+            csp["latitude"],
+            csp["longitude"],
+            tilt,
+            csp["collector_azimuth"],
+            csp["cleanliness"],
+            csp["eta_0"],
+            csp["c_1"],
+            csp["c_2"],
+            csp["temp_collector_inlet"],
+            csp["temp_collector_outlet"],
+            csp_weather["temp_amb"],
+            csp["a_1"],
+            csp["a_2"],
+            E_dir_hor=csp_weather["irradiance"],
+        )
+        assert collector.collectors_heat.tolist() == approx(
+            expected["collector_heat"].tolist()
+        )
+
+
 def test_allocate_emissions():
     emissions_dict = {}
     for method in ["iea", "efficiency", "finnish"]:
@@ -303,6 +1052,151 @@ def test_allocate_emission_series():
             ), f"Result \n{em_result} does not match default \n{em_default}"
 
 
+def test_allocate_emissions_portfolio():
+    """Test if the portfolio allocation equals allocate_emissions per
+    plant."""
+    plants = pd.DataFrame(
+        {
+            "method": ["iea", "finnish", "efficiency", "finnish"],
+            "eta_el": [0.3, 0.35, 0.4, 0.3],
+            "eta_el_ref": [0.525] * 4,
+            "eta_th_ref": [0.82] * 4,
+        },
+        index=["a", "b", "c", "d"],
+    )
+    total_emissions = pd.DataFrame(
+        [[200.0, 100.0, 0.0]] * 4, index=plants.index, columns=[0, 1, 2]
+    )
+    eta_th = pd.DataFrame(
+        [[0.5, 0.45, 0.4]] * 4, index=plants.index, columns=[0, 1, 2]
+    )
+    em_el, em_th = allocate_emissions_portfolio(
+        total_emissions,
+        eta_el=plants["eta_el"],
+        eta_th=eta_th,
+        method=plants["method"],
+        eta_el_ref=plants["eta_el_ref"],
+        eta_th_ref=plants["eta_th_ref"],
+    )
+    assert em_el.index.equals(plants.index)
+    for plant, row in plants.iterrows():
+        expected = allocate_emissions(
+            total_emissions.loc[plant],
+            eta_el=row["eta_el"],
+            eta_th=eta_th.loc[plant],
+            method=row["method"],
+            eta_el_ref=row["eta_el_ref"],
+            eta_th_ref=row["eta_th_ref"],
+        )
+        assert em_el.loc[plant].tolist() == approx(expected[0].tolist())
+        assert em_th.loc[plant].tolist() == approx(expected[1].tolist())
+
+    with pytest.raises(ValueError):
+        allocate_emissions_portfolio(
+            total_emissions, 0.3, eta_th, plants["method"]
+        )
+
+
+def test_allocate_emissions_portfolio_aligns_plants():
+    """Test if the methods and efficiencies of a plant table are aligned
+    with the rows of total_emissions regardless of their order."""
+    plants = pd.DataFrame(
+        {
+            "method": ["efficiency", "iea"],
+            "eta_el": [0.4, 0.3],
+        },
+        index=["b", "a"],
+    )
+    total_emissions = pd.DataFrame(
+        [[200.0, 100.0], [100.0, 50.0]], index=["a", "b"], columns=[0, 1]
+    )
+    em_el, em_th = allocate_emissions_portfolio(
+        total_emissions,
+        eta_el=plants["eta_el"],
+        eta_th=0.5,
+        method=plants["method"],
+    )
+    for plant, row in plants.iterrows():
+        expected = allocate_emissions(
+            total_emissions.loc[plant],
+            eta_el=row["eta_el"],
+            eta_th=0.5,
+            method=row["method"],
+        )
+        assert em_el.loc[plant].tolist() == approx(expected[0].tolist())
+        assert em_th.loc[plant].tolist() == approx(expected[1].tolist())
+
+    with pytest.raises(ValueError, match="'c'"):
+        allocate_emissions_portfolio(
+            total_emissions.rename(index={"b": "c"}),
+            eta_el=0.3,
+            eta_th=0.5,
+            method=plants["method"],
+        )
+
+
+def test_allocate_emissions_from_results():
+    """Test the allocation with a results dict shaped like the one of
+    oemof.solph."""
+    timeindex = pd.date_range("1/1/2020", periods=3, freq="h")
+
+    def flow(values):
+        return {
+            "scalars": pd.Series(dtype=float),
+            "sequences": pd.DataFrame({"flow": values}, index=timeindex),
+        }
+
+    results = {
+        ("gas", "chp_1"): flow([100.0, 50.0, 0.0]),
+        ("chp_1", "electricity"): flow([30.0, 15.0, 0.0]),
+        ("chp_1", "heat"): flow([50.0, 25.0, 0.0]),
+        ("gas", "chp_2"): flow([200.0, 200.0, 200.0]),
+        ("chp_2", "electricity"): flow([70.0, 70.0, 70.0]),
+        ("chp_2", "heat"): flow([100.0, 100.0, 100.0]),
+        ("gas", "boiler"): flow([10.0, 10.0, 10.0]),
+        ("boiler", "heat"): flow([9.0, 9.0, 9.0]),
+        ("chp_2", None): flow([0.0, 0.0, 0.0]),
+    }
+    chps = {
+        "chp_1": {
+            "emission_factor": 2,
+            "electricity_bus": "electricity",
+            "heat_bus": "heat",
+            "method": "iea",
+        },
+        "chp_2": {
+            "emission_factor": 1,
+            "electricity_bus": "electricity",
+            "heat_bus": "heat",
+            "method": "finnish",
+            "eta_el_ref": 0.525,
+            "eta_th_ref": 0.82,
+        },
+    }
+    allocation = allocate_emissions_from_results(results, chps)
+
+    assert allocation.index.names == ["chp", "timestep"]
+    assert allocation.loc["chp_1", "emissions_electricity"].tolist() == (
+        approx([75.0, 37.5, 0.0])
+    )
+    assert allocation.loc["chp_1", "emissions_heat"].tolist() == (
+        approx([125.0, 62.5, 0.0])
+    )
+    expected = allocate_emissions(
+        200, 0.35, 0.5, "finnish", eta_el_ref=0.525, eta_th_ref=0.82
+    )
+    assert allocation.loc["chp_2", "emissions_electricity"].tolist() == (
+        approx([expected[0]] * 3)
+    )
+    assert allocation.loc["chp_2", "emissions_heat"].tolist() == (
+        approx([expected[1]] * 3)
+    )
+
+    chps["chp_1"]["method"] = "finnish"
+    with pytest.raises(ValueError, match="'chp_1'"):
+        allocate_emissions_from_results(results, chps)
+
+
 def test_calculation_of_collector_irradiance():
     s = pd.Series([10, 20, 30], index=[1, 2, 3])
     res = csp.calc_collector_irradiance(s, 0.9)
@@ -316,7 +1210,7 @@ def test_calculation_of_collector_irradiance():
 def test_calculation_iam_for_single_value():
     res = csp.calc_iam(-0.00159, 0.0000977, 0, 0, 0, 0, 50, "Janotte")
 
-    assert res == 0.8352499999999999
+    assert res == approx(0.8352499999999999)
 
 
 def test_calculation_iam_andasol():
@@ -331,7 +1225,23 @@ def test_calculation_iam_andasol():
         "Andasol",
     )
 
-    assert res == 0.5460625000000001
+    assert res == approx(0.5460625000000001)
+
+
+def test_calculation_iam_polynomial():
+    """Test if arbitrary orders match the expanded polynomial."""
+    coefficients = [-8.65e-4, 8.87e-4, -5.425e-5, 1.665e-6, -2.309e-8, 1e-12]
+    aoi = pd.Series([0, 10, 45, 80], index=[1, 2, 3, 4])
+    res = csp.calc_iam_polynomial(coefficients, aoi)
+    expected = 1 - sum(
+        a * aoi.abs() ** k for k, a in enumerate(coefficients, start=1)
+    )
+    assert res.index.equals(aoi.index)
+    assert res.values == approx(expected.values)
+    assert csp.calc_iam_polynomial([], 30) == 1
+    res = csp.calc_iam_polynomial(coefficients, [0, 10])
+    assert isinstance(res, list)
+    assert res == approx(expected.tolist()[:2])
 
 
 def test_calculation_iam_for_a_series():
@@ -616,6 +1526,47 @@ def test_calc_characteristic_temp_input_list_single_entry():
     assert ddt == [37]
 
 
+def test_calc_characteristic_temp_broadcast():
+    """Test if calc_characteristic_temp broadcasts scalars, arrays and
+    Series and returns the container type of the input."""
+    t_cool = pd.Series([30.0, 20.0], index=["a", "b"])
+    ddt = ac.calc_characteristic_temp(
+        t_hot=85,
+        t_cool=t_cool,
+        t_chill=np.array([15.0]),
+        coef_a=2.5,
+        coef_e=1.8,
+        method="kuehn_and_ziegler",
+    )
+    assert ddt.index.equals(t_cool.index)
+    assert ddt.tolist() == [approx(37), approx(62)]
+    ddt = ac.calc_characteristic_temp(
+        t_hot=85,
+        t_cool=np.array([30.0, 20.0]),
+        t_chill=15,
+        coef_a=2.5,
+        coef_e=1.8,
+        method="kuehn_and_ziegler",
+    )
+    assert isinstance(ddt, np.ndarray)
+    assert ac.calc_characteristic_temp(
+        85, 30, 15, 2.5, 1.8, "kuehn_and_ziegler"
+    ) == approx(37)
+    Q_dots = ac.calc_heat_flux(
+        ddts=ddt, coef_s=24.121, coef_r=-553.194, method="kuehn_and_ziegler"
+    )
+    assert isinstance(Q_dots, np.ndarray)
+    assert Q_dots[0] == approx(24.121 * 37 - 553.194)
+    # 0-d arrays count as single values, as in calc_cops
+    ddt = ac.calc_characteristic_temp(
+        np.array(85.0), 30, 15, 2.5, 1.8, "kuehn_and_ziegler"
+    )
+    assert isinstance(ddt, float)
+    assert isinstance(
+        cmpr_hp_chllr.calc_cops("heat_pump", np.array(40.0), 10, 0.5), float
+    )
+
+
 def test_calc_heat_flux_evaporator():
     """Test calculation of cooling capacity for chiller 'Broad_01'."""
     Q_dots_evap = ac.calc_heat_flux(
@@ -633,10 +1584,10 @@ def test_calc_heat_flux_generator():
 
 
 def test_raised_exception_argument_type_01():
-    """Test if an exception is raised if input argument is not a list."""
+    """Test if an exception is raised if input argument is of wrong type."""
     with pytest.raises(TypeError):
         ac.calc_characteristic_temp(
-            t_hot=85,
+            t_hot="85",
             t_cool=[30],
             t_chill=[15],
             coef_a=2.5,
@@ -646,11 +1597,11 @@ def test_raised_exception_argument_type_01():
 
 
 def test_raised_exception_argument_type_02():
-    """Test if an exception is raised if input argument is not a list."""
+    """Test if an exception is raised if input argument is of wrong type."""
     with pytest.raises(TypeError):
         ac.calc_characteristic_temp(
             t_hot=[85],
-            t_cool=30,
+            t_cool="30",
             t_chill=[15],
             coef_a=2.5,
             coef_e=1.8,
@@ -659,12 +1610,12 @@ def test_raised_exception_argument_type_02():
 
 
 def test_raised_exception_argument_type_03():
-    """Test if an exception is raised if input argument is not a list."""
+    """Test if an exception is raised if input argument is of wrong type."""
     with pytest.raises(TypeError):
         ac.calc_characteristic_temp(
             t_hot=[85],
             t_cool=[30],
-            t_chill=15,
+            t_chill="15",
             coef_a=2.5,
             coef_e=1.8,
             method="kuehn_and_ziegler",
@@ -716,3 +1667,388 @@ def test_raised_exception_method_selection_02():
         ac.calc_heat_flux(
             ddts=25, coef_s=0.42, coef_r=0.9, method="shaken_not_stirred"
         )
+
+
+def test_define_AC_specs():
+    """Test calculation of COPs and normed cooling capacity."""
+    AC_specs = ac.define_AC_specs(
+        Q_dots_evap=[5.0, 10.0, 8.0], Q_dots_gen=[10.0, 12.5, 10.0]
+    )
+    assert AC_specs["COPs"] == [0.5, 0.8, 0.8]
+    assert AC_specs["Q_chill_max"] == [0.5, 1.0, 0.8]
+    assert AC_specs["Q_chill_nominal"] == 10.0
+
+    AC_specs = ac.define_AC_specs(
+        Q_dots_evap=np.array([5.0, 10.0]), Q_dots_gen=np.array([10.0, 12.5])
+    )
+    assert isinstance(AC_specs["COPs"], np.ndarray)
+    assert AC_specs["COPs"].tolist() == [0.5, 0.8]
+
+
+def test_define_AC_specs_with_Series_and_out():
+    """Test if Series keep their index and buffers are reused."""
+    Q_dots_evap = pd.Series([5.0, 10.0], index=["a", "b"])
+    Q_dots_gen = pd.Series([10.0, 12.5], index=["a", "b"])
+    AC_specs = ac.define_AC_specs(Q_dots_evap, Q_dots_gen)
+    assert AC_specs["COPs"].equals(pd.Series([0.5, 0.8], index=["a", "b"]))
+
+    out = {"COPs": np.empty(2), "Q_chill_max": np.empty(2)}
+    AC_specs = ac.define_AC_specs(Q_dots_evap, Q_dots_gen, out=out)
+    assert AC_specs["COPs"] is out["COPs"]
+    assert out["Q_chill_max"].tolist() == [0.5, 1.0]
+
+
+def test_calc_eta_c_flate_plate_masks_and_clips():
+    """Test if efficiency is 0 for non-positive irradiance and clipped at 0."""
+    index = pd.date_range("2003-01-01", periods=4, freq="h")
+    params = {
+        "eta_0": 0.73,
+        "a_1": 1.7,
+        "a_2": 0.016,
+        "temp_collector_inlet": pd.Series([20, 20, 20, 60], index=index),
+        "delta_temp_n": 10,
+        "temp_amb": pd.Series([9, 9, 9, 0], index=index),
+        "collector_irradiance": pd.Series([99.84, 0, -5, 50], index=index),
+    }
+    eta_c = calc_eta_c_flate_plate(**params)
+    assert eta_c.index.equals(index)
+    assert eta_c.iloc[0] == approx(0.30176452266786186, rel=1e-3)
+    assert eta_c.iloc[1:].tolist() == [0, 0, 0]
+
+
+def test_solar_position_cache():
+    """Test if identical solar positions are calculated only once."""
+    index = pd.date_range(
+        "2003-01-01 12:00", periods=3, freq="h", tz="Europe/Berlin"
+    )
+    uncached = solar_position.get_solarposition(index, 52.2443, 10.5594)
+    with solar_position.solar_position_cache(maxsize=1) as cache:
+        first = solar_position.get_solarposition(index, 52.2443, 10.5594)
+        second = solar_position.get_solarposition(
+            index.copy(), 52.2443, 10.5594
+        )
+        assert first is second
+        assert cache.info() == {
+            "hits": 1,
+            "misses": 1,
+            "maxsize": 1,
+            "currsize": 1,
+        }
+        # A different site evicts the least recently used entry
+        solar_position.get_solarposition(index, 48.0, 10.5594)
+        solar_position.get_solarposition(index, 52.2443, 10.5594)
+        assert cache.misses == 3 and len(cache) == 1
+    assert solar_position._cache is None
+    pd.testing.assert_frame_equal(first, uncached)
+
+
+def test_flat_plate_precalc_orientations():
+    """Test if the batch mode matches flat_plate_precalc per orientation."""
+    index = pd.date_range(
+        "2003-06-01 06:00", periods=6, freq="2h", tz="Europe/Berlin"
+    )
+    params = {
+        "lat": 52.2443,
+        "long": 10.5594,
+        "eta_0": 0.73,
+        "a_1": 1.7,
+        "a_2": 0.016,
+        "temp_collector_inlet": 20,
+        "delta_temp_n": 10,
+        "irradiance_global": pd.Series(
+            [150, 400, 700, 750, 500, 200], index=index
+        ),
+        "irradiance_diffuse": pd.Series(
+            [100, 150, 200, 220, 180, 120], index=index
+        ),
+        "temp_amb": pd.Series([12, 15, 20, 22, 21, 17], index=index),
+    }
+    tilts = [10, 30, 45]
+    azimuths = [180, 90, 270]
+    data = flat_plate_precalc_orientations(
+        collector_tilt=tilts, collector_azimuth=azimuths, **params
+    )
+    assert data["collectors_heat"].shape == (6, 3)
+    for tilt, azimuth in zip(tilts, azimuths):
+        single = flat_plate_precalc(
+            collector_tilt=tilt, collector_azimuth=azimuth, **params
+        )
+        for quantity in ["col_ira", "eta_c", "collectors_heat"]:
+            assert data[quantity][(tilt, azimuth)].values == approx(
+                single[quantity].values
+            )
+
+
+def test_precalc_sites_parallel_matches_serial():
+    """Test if the parallel multi-site driver equals the serial path."""
+    index = pd.date_range(
+        "2003-06-01 06:00", periods=4, freq="3h", tz="Europe/Berlin"
+    )
+    weather = {
+        "irradiance_global": pd.Series([150, 700, 750, 200], index=index),
+        "irradiance_diffuse": pd.Series([100, 200, 220, 120], index=index),
+        "temp_amb": pd.Series([12, 20, 22, 17], index=index),
+    }
+    sites = pd.DataFrame(
+        [
+            {"lat": 52.2443, "long": 10.5594, **weather},
+            {"lat": 48.1, "long": 11.6, **weather},
+            {"lat": 40.4, "long": -3.7, **weather},
+        ]
+    )
+    collector = {
+        "collector_tilt": 10,
+        "collector_azimuth": 180,
+        "eta_0": 0.73,
+        "a_1": 1.7,
+        "a_2": 0.016,
+        "temp_collector_inlet": 20,
+        "delta_temp_n": 10,
+    }
+    serial = list(
+        precalc_sites(flat_plate_precalc, sites, max_workers=1, **collector)
+    )
+    stats = {}
+    parallel = list(
+        precalc_sites(
+            flat_plate_precalc,
+            sites,
+            max_workers=2,
+            chunksize=2,
+            stats=stats,
+            **collector,
+        )
+    )
+    assert len(parallel) == 3
+    for result_parallel, result_serial in zip(parallel, serial):
+        pd.testing.assert_frame_equal(result_parallel, result_serial)
+    assert stats["sites"] == 3 and stats["pickled_bytes"] > 0
+    assert stats["total"] >= stats["startup"] > 0
+
+
+def test_csp_precalc_chunks_equals_csp_precalc():
+    """Test if the chunked precalculation matches the full one."""
+    index = pd.date_range(
+        "2003-08-22 05:00", periods=10, freq="h", tz="Asia/Muscat"
+    )
+    E_dir_hor = pd.Series(
+        [0, 50, 200, 400, 550, 650, 700, 650, 500, 300], index=index
+    )
+    t_amb = pd.Series(range(28, 38), index=index, dtype=float)
+    params = {
+        "lat": 23.614328,
+        "long": 58.545284,
+        "collector_tilt": 10,
+        "collector_azimuth": 180,
+        "cleanliness": 0.9,
+        "eta_0": 0.816,
+        "c_1": 0.0622,
+        "c_2": 0.00023,
+        "temp_collector_inlet": 435,
+        "temp_collector_outlet": pd.Series(500.0, index=index),
+        "temp_amb": t_amb,
+        "a_1": -0.00159,
+        "a_2": 0.0000977,
+        "E_dir_hor": E_dir_hor,
+    }
+    full = csp.csp_precalc(**params)
+    chunks = list(csp.csp_precalc_chunks(chunk_size=4, **params))
+    assert [len(chunk) for chunk in chunks] == [4, 4, 2]
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks),
+        full[["collector_irradiance", "eta_c", "collector_heat"]],
+    )
+
+
+def test_calc_collector_output_matches_single_functions():
+    """Test if the fused kernel equals the single functions and fills
+    caller-provided buffers."""
+    irradiance_on_collector = pd.Series([-10, 0, 50, 400, np.nan])
+    iam = pd.Series([0.95, 0.95, 0.95, 0.9, 0.9])
+    t_amb = pd.Series([30, 30, 31, 32, 32])
+    collector_irradiance = csp.calc_collector_irradiance(
+        irradiance_on_collector, 0.9
+    )
+    eta_c = csp.calc_eta_c(
+        0.816,
+        0.0622,
+        0.00023,
+        iam,
+        235,
+        300,
+        t_amb,
+        collector_irradiance,
+        "Janotte",
+    )
+    heat = csp.calc_heat_coll(eta_c, collector_irradiance)
+
+    out = (np.empty(5), np.empty(5), np.empty(5))
+    result = csp.calc_collector_output(
+        irradiance_on_collector,
+        0.9,
+        0.816,
+        0.0622,
+        0.00023,
+        iam,
+        235,
+        300,
+        t_amb,
+        "Janotte",
+        out=out,
+    )
+    for buffer, fused, single in zip(
+        out, result, [collector_irradiance, eta_c, heat]
+    ):
+        assert fused is buffer
+        assert fused.tolist() == single.tolist()
+    assert eta_c.tolist()[:2] == [0, 0]
+
+
+def test_calc_cops_fleet():
+    """Test if fleet COPs equal calc_cops per unit."""
+    temp_ambient = np.array([-5, 1.5, 2.5, 10])
+    quality_grades = [0.4, 0.5, 0.45]
+    temp_sinks = [[35], [45], [55]]
+    factors_icing = [0.8, 1, 0.9]
+    cops = cmpr_hp_chllr.calc_cops_fleet(
+        mode="heat_pump",
+        temp_high=temp_sinks,
+        temp_low=temp_ambient,
+        quality_grade=quality_grades,
+        factor_icing=factors_icing,
+    )
+    assert cops.shape == (3, 4)
+    for unit in range(3):
+        expected = cmpr_hp_chllr.calc_cops(
+            mode="heat_pump",
+            temp_high=temp_sinks[unit],
+            temp_low=temp_ambient,
+            quality_grade=quality_grades[unit],
+            factor_icing=factors_icing[unit],
+        )
+        assert cops[unit] == approx(expected)
+
+    nominal_conditions = {
+        "nominal_Q_hot": np.array([20, 30, 40]),
+        "nominal_el_consumption": np.array([5, 6, 10]),
+    }
+    max_Q_hot = cmpr_hp_chllr.calc_max_Q_dot_heat(nominal_conditions, cops)
+    assert max_Q_hot.shape == (3, 4)
+    assert max_Q_hot[1] == approx(cops[1] / 5)
+
+
+def test_cop_table():
+    """Test if interpolated COPs stay within the documented error bound."""
+    table = cmpr_hp_chllr.COPTable(
+        mode="heat_pump",
+        quality_grade=0.4,
+        temp_high=np.arange(30, 61, 2.0),
+        temp_low=np.arange(-20, 21, 2.0),
+        factor_icing=0.8,
+    )
+    rng = np.random.default_rng(42)
+    temp_high = rng.uniform(30, 60, 1000)
+    temp_low = pd.Series(rng.uniform(-20, 20, 1000))
+    exact = cmpr_hp_chllr.calc_cops(
+        "heat_pump", temp_high, temp_low, 0.4, factor_icing=0.8
+    )
+    interpolated = table(temp_high, temp_low)
+    assert interpolated.index.equals(temp_low.index)
+    assert (interpolated - exact).abs().max() <= table.error_bound
+    assert table(40, 12) == approx(4.473571428571428)
+
+    restored = pickle.loads(pickle.dumps(table))
+    assert restored(temp_high, temp_low).equals(interpolated)
+
+    with pytest.raises(ValueError):
+        table(40, 25)
+
+
+def test_load_characteristic_parameters():
+    """Test lookup by name and id, caching and reloading of the library."""
+    filename_charpara = os.path.join(
+        os.path.dirname(__file__),
+        "../examples/absorption_heatpump_and_chiller/"
+        "data/characteristic_parameters.csv",
+    )
+    library = ac.load_characteristic_parameters(filename_charpara)
+    assert library["Kuehn"] == ("Kuehn", 5, 2.5, 1.8, 0.42, 0.9, 0.51, 2.0)
+    assert library.by_id(3).name == "Broad_01"
+    assert len(library) == 5
+    assert ac.load_characteristic_parameters(filename_charpara) is library
+    assert (
+        ac.reload_characteristic_parameters(filename_charpara) is not library
+    )
+    with pytest.raises(TypeError):
+        library["Kuehn"] = library["Safarik"]
+
+
+def test_calc_chiller_operation():
+    """Test if the single-pass pipeline equals the stepwise calculation."""
+    chiller = ac.CharacteristicParameters(
+        "Kuehn", 5, 2.5, 1.8, 0.42, 0.9, 0.51, 2.0
+    )
+    t_cool = pd.Series([23.0, 27.0, 31.0], index=["a", "b", "c"])
+    operation = ac.calc_chiller_operation(
+        t_hot=85, t_cool=t_cool, t_chill=[15], parameters=chiller
+    )
+    ddts = ac.calc_characteristic_temp(
+        t_hot=[85],
+        t_cool=t_cool.tolist(),
+        t_chill=[15],
+        coef_a=chiller.a,
+        coef_e=chiller.e,
+        method="kuehn_and_ziegler",
+    )
+    Q_dots_evap = ac.calc_heat_flux(
+        ddts, chiller.s_E, chiller.r_E, "kuehn_and_ziegler"
+    )
+    Q_dots_gen = ac.calc_heat_flux(
+        ddts, chiller.s_G, chiller.r_G, "kuehn_and_ziegler"
+    )
+    assert operation["ddts"].tolist() == ddts
+    assert operation["Q_dots_evap"].tolist() == Q_dots_evap
+    assert operation["COPs"].index.equals(t_cool.index)
+    assert operation["COPs"].tolist() == [
+        e / g for e, g in zip(Q_dots_evap, Q_dots_gen)
+    ]
+    assert operation["Q_chill_max"].max() == 1
+    assert operation["Q_chill_nominal"] == max(Q_dots_evap)
+
+    operation = ac.calc_chiller_operation(
+        85, [23.0, 27.0], 15, chiller._asdict(), nominal_Q_dot_evap=10
+    )
+    assert operation["Q_chill_max"] == approx(np.array(Q_dots_evap[:2]) / 10)
+    with pytest.raises(TypeError, match="t_hot"):
+        ac.calc_chiller_operation("85", 25, 15, chiller)
+    with pytest.raises(ValueError, match="t_chill"):
+        ac.calc_chiller_operation(85, [25, 26, 27], [15, 16], chiller)
+
+
+def test_calc_library_operation():
+    """Test if the library evaluation equals the evaluation per chiller."""
+    filename_charpara = os.path.join(
+        os.path.dirname(__file__),
+        "../examples/absorption_heatpump_and_chiller/"
+        "data/characteristic_parameters.csv",
+    )
+    library = ac.load_characteristic_parameters(filename_charpara)
+    t_cool = pd.Series([23.0, 27.0, 31.0], index=["a", "b", "c"])
+    operation = ac.calc_library_operation(
+        t_hot=85, t_cool=t_cool, t_chill=15, parameters=library
+    )
+    assert operation["COPs"].shape == (len(library), len(t_cool))
+    assert operation["COPs"].columns.equals(t_cool.index)
+    for name, chiller in library.items():
+        single = ac.calc_chiller_operation(85, t_cool, 15, chiller)
+        for key in ["ddts", "Q_dots_evap", "Q_dots_gen", "COPs"]:
+            assert operation[key].loc[name].tolist() == approx(
+                single[key].tolist()
+            )
+
+    table = pd.read_csv(filename_charpara)
+    from_table = ac.calc_library_operation(85, [23.0, 27.0], 15, table)
+    assert from_table["Q_dots_evap"].index.tolist() == table["name"].tolist()
+    assert from_table["Q_dots_evap"].loc["Kuehn"].tolist() == approx(
+        operation["Q_dots_evap"].loc["Kuehn"].tolist()[:2]
+    )
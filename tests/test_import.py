@@ -0,0 +1,51 @@
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["pvlib", "oemof.solph", "pyomo", "scipy"]
+
+
+def _import_in_subprocess(statement, heavy_modules=HEAVY_MODULES):
+    """Imports in a fresh interpreter and returns the heavy modules that
+    were loaded."""
+    code = (
+        "import sys\n"
+        f"{statement}\n"
+        f"loaded = [m for m in {heavy_modules!r} if m in sys.modules]\n"
+        "print(*loaded)\n"
+    )
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.split()
+
+
+def test_import_is_lazy():
+    """Test if importing the package loads no heavy dependencies."""
+    loaded = _import_in_subprocess(
+        "import oemof.thermal", HEAVY_MODULES + ["pandas"]
+    )
+    assert loaded == []
+
+
+@pytest.mark.parametrize(
+    "module",
+    ["stratified_thermal_storage", "cogeneration", "fluid_properties"],
+)
+def test_import_of_lightweight_module_is_lazy(module):
+    """Test if lightweight submodules do not load pvlib, solph, pyomo or
+    scipy."""
+    loaded = _import_in_subprocess(f"from oemof.thermal import {module}")
+    assert loaded == []
+
+
+def test_lazy_submodule_access():
+    import oemof.thermal
+
+    assert oemof.thermal.cogeneration.allocate_emissions is not None
+    assert "facades" in dir(oemof.thermal)
+    with pytest.raises(AttributeError):
+        oemof.thermal.not_a_submodule